@@ -37,11 +37,18 @@ class Config:
     CONTEXT_INJECTION_ENABLED = True
     SHOW_CONTEXT_SUMMARY = True
 
+    # Conversation recording settings
+    CONVERSATION_BUFFER_SIZE = 10000  # most recent interactions kept in memory
+    MEMORY_QUEUE_SIZE = 256  # pending auto-recorded memories before dropping
+
     # Logging configuration
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     LOG_FILE = LOGS_DIR / "mcp_server.log"
 
+    # Thread pool used for blocking work offloaded from the event loop
+    THREAD_POOL_SIZE = 16
+
     # MCP Protocol settings
     MCP_PROTOCOL_VERSION = "2024-11-05"
     SERVER_NAME = "mcp-context-manager-python"
@@ -78,6 +85,12 @@ def load_env_config():
     Config.ENABLE_PERFORMANCE_MONITORING = (
         os.getenv("MCP_PERFORMANCE_MONITORING", "true").lower() == "true"
     )
+    Config.CONVERSATION_BUFFER_SIZE = int(
+        os.getenv("MCP_CONVERSATION_BUFFER_SIZE", Config.CONVERSATION_BUFFER_SIZE)
+    )
+    Config.THREAD_POOL_SIZE = int(
+        os.getenv("MCP_THREAD_POOL_SIZE", Config.THREAD_POOL_SIZE)
+    )
 
 
 # Initialize configuration
@@ -4,14 +4,47 @@ Simple MCP Server Test
 Test basic MCP server functionality
 """
 
+import asyncio
 import json
-import subprocess
 import sys
-import time
 from pathlib import Path
 
+STARTUP_TIMEOUT = 10.0
+RESPONSE_TIMEOUT = 5.0
 
-def test_mcp_server():
+
+async def _drain(stream):
+    """Discard server stderr so a full pipe never stalls the server."""
+    while await stream.read(65536):
+        pass
+
+
+async def send_request(process, message):
+    """Send one newline-delimited JSON-RPC message to the server."""
+    process.stdin.write((json.dumps(message) + "\n").encode("utf-8"))
+    await process.stdin.drain()
+
+
+async def read_response(process, timeout):
+    """Return the next JSON line from stdout, skipping other output."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            return None
+        try:
+            line = await asyncio.wait_for(process.stdout.readline(), remaining)
+        except asyncio.TimeoutError:
+            return None
+        if not line:
+            return None
+        text = line.decode("utf-8", errors="replace").strip()
+        if text.startswith("{"):
+            return text
+
+
+async def test_mcp_server():
     """Test basic MCP server functionality."""
     print("🧪 **Testing MCP Server**")
     print("=" * 50)
@@ -20,21 +53,21 @@ def test_mcp_server():
     server_script = project_path / "src" / "simple_mcp_server.py"
 
     print("1. Starting MCP server...")
-    process = subprocess.Popen(
-        [sys.executable, str(server_script)],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        str(server_script),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
         env={
             "PYTHONPATH": str(project_path),
             "MCP_PROJECT_ID": "mcp-context-manager-python",
         },
     )
 
-    try:
-        time.sleep(2)  # Wait for server to start
+    stderr_task = asyncio.create_task(_drain(process.stderr))
 
+    try:
         print("2. Testing initialization...")
         init_message = {
             "jsonrpc": "2.0",
@@ -47,10 +80,11 @@ def test_mcp_server():
             },
         }
 
-        process.stdin.write(json.dumps(init_message) + "\n")
-        process.stdin.flush()
+        await send_request(process, init_message)
 
-        response = process.stdout.readline()
+        # The request waits in the pipe until the server is up, so the first
+        # response doubles as the readiness probe
+        response = await read_response(process, STARTUP_TIMEOUT)
         if not response:
             raise RuntimeError("No initialization response")
 
@@ -65,10 +99,9 @@ def test_mcp_server():
             "params": {},
         }
 
-        process.stdin.write(json.dumps(tools_message) + "\n")
-        process.stdin.flush()
+        await send_request(process, tools_message)
 
-        response = process.stdout.readline()
+        response = await read_response(process, RESPONSE_TIMEOUT)
         if not response:
             raise RuntimeError("No tools list response")
 
@@ -90,10 +123,9 @@ def test_mcp_server():
             },
         }
 
-        process.stdin.write(json.dumps(context_message) + "\n")
-        process.stdin.flush()
+        await send_request(process, context_message)
 
-        response = process.stdout.readline()
+        response = await read_response(process, RESPONSE_TIMEOUT)
         if not response:
             raise RuntimeError("No context summary response")
 
@@ -118,9 +150,11 @@ def test_mcp_server():
         print(f"❌ Test failed: {e}")
 
     finally:
-        process.terminate()
-        process.wait()
+        if process.returncode is None:
+            process.terminate()
+        await process.wait()
+        await stderr_task
 
 
 if __name__ == "__main__":
-    test_mcp_server()
+    asyncio.run(test_mcp_server())
@@ -150,6 +150,30 @@ class EmbeddingService:
             print(f"Failed to calculate similarity: {e}")
             return 0.0
 
+    def calculate_similarities(
+        self, embedding: List[float], embeddings: List[List[float]]
+    ) -> List[float]:
+        """Calculate cosine similarity between one embedding and many others."""
+        if not embedding or not embeddings:
+            return [0.0] * len(embeddings)
+
+        try:
+            # One matrix-vector product instead of a Python loop of pairs
+            query = np.asarray(embedding, dtype=float)
+            matrix = np.asarray(embeddings, dtype=float)
+            dots = matrix @ query
+            norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+            similarities = np.divide(
+                dots, norms, out=np.zeros_like(dots), where=norms != 0
+            )
+
+            # Ensure results are between 0 and 1
+            return np.clip(similarities, 0.0, 1.0).tolist()
+
+        except Exception:
+            # Ragged embeddings cannot form a matrix; compare them pairwise
+            return [self.calculate_similarity(embedding, other) for other in embeddings]
+
     async def batch_generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for multiple texts efficiently."""
         if settings.embedding_model == "openai":
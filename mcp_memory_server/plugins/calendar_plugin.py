@@ -11,6 +11,35 @@ from mcp_memory_server.models.memory import Memory
 
 from .base import BasePlugin
 
+# Date expressions, compiled once for every plugin instance
+_DATE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\b\d{1,2}/\d{1,2}/\d{4}\b",  # MM/DD/YYYY
+        r"\b\d{4}-\d{2}-\d{2}\b",  # YYYY-MM-DD
+        r"\b(today|tomorrow|next week|next month)\b",  # Relative dates
+        r"\b(deadline|due date|meeting|appointment)\b",  # Event keywords
+    )
+]
+
+# Event keywords matched against lowercased memory content
+_EVENT_KEYWORDS = (
+    "deadline",
+    "due date",
+    "meeting",
+    "appointment",
+    "call",
+    "conference",
+    "presentation",
+    "review",
+)
+
+# Static part of get_plugin_info(), built once
+_CALENDAR_PLUGIN_INFO = {
+    "date_patterns": len(_DATE_PATTERNS),
+    "event_keywords": len(_EVENT_KEYWORDS),
+}
+
 
 class CalendarPlugin(BasePlugin):
     """Plugin for extracting and processing calendar-related memories."""
@@ -20,12 +49,7 @@ class CalendarPlugin(BasePlugin):
             name="calendar_plugin",
             description="Extracts calendar events and deadlines from memories",
         )
-        self.date_patterns = [
-            r"\b\d{1,2}/\d{1,2}/\d{4}\b",  # MM/DD/YYYY
-            r"\b\d{4}-\d{2}-\d{2}\b",  # YYYY-MM-DD
-            r"\b(today|tomorrow|next week|next month)\b",  # Relative dates
-            r"\b(deadline|due date|meeting|appointment)\b",  # Event keywords
-        ]
+        self.date_patterns = _DATE_PATTERNS
 
     def process_memory(self, memory: Memory) -> Memory:
         """Extract calendar information from memory content."""
@@ -60,37 +84,16 @@ class CalendarPlugin(BasePlugin):
         """Extract dates from content."""
         dates = []
         for pattern in self.date_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            dates.extend(matches)
+            dates.extend(pattern.findall(content))
         return list(set(dates))
 
     def _extract_events(self, content: str) -> List[str]:
         """Extract event keywords from content."""
-        event_keywords = [
-            "deadline",
-            "due date",
-            "meeting",
-            "appointment",
-            "call",
-            "conference",
-            "presentation",
-            "review",
-        ]
-
-        events = []
-        for keyword in event_keywords:
-            if keyword.lower() in content.lower():
-                events.append(keyword)
-
-        return events
+        content_lower = content.lower()
+        return [keyword for keyword in _EVENT_KEYWORDS if keyword in content_lower]
 
     def get_plugin_info(self) -> Dict[str, Any]:
         """Get plugin information."""
         info = super().get_plugin_info()
-        info.update(
-            {
-                "date_patterns": len(self.date_patterns),
-                "event_keywords": 8,  # Number of event keywords
-            }
-        )
+        info.update(_CALENDAR_PLUGIN_INFO)
         return info
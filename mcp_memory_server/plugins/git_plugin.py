@@ -10,6 +10,23 @@ from mcp_memory_server.models.memory import Memory
 
 from .base import BasePlugin
 
+# Git references, compiled once for every plugin instance
+_GIT_PATTERNS = {
+    key: re.compile(pattern, re.IGNORECASE)
+    for key, pattern in {
+        "commit_hash": r"\b[a-f0-9]{7,40}\b",
+        "branch_name": r"\b(main|master|develop|feature|bugfix|hotfix)/[\w-]+\b",
+        "repository": r"\b(github\.com|gitlab\.com|bitbucket\.org)/[\w-]+/[\w-]+\b",
+        "git_commands": r"\b(git add|git commit|git push|git pull|git merge|git branch)\b",
+    }.items()
+}
+
+# Static part of get_plugin_info(), built once
+_GIT_PLUGIN_INFO = {
+    "git_patterns": len(_GIT_PATTERNS),
+    "supported_patterns": list(_GIT_PATTERNS),
+}
+
 
 class GitPlugin(BasePlugin):
     """Plugin for extracting and processing Git-related memories."""
@@ -19,12 +36,7 @@ class GitPlugin(BasePlugin):
             name="git_plugin",
             description="Extracts Git commits, branches, and repository information from memories",
         )
-        self.git_patterns = {
-            "commit_hash": r"\b[a-f0-9]{7,40}\b",
-            "branch_name": r"\b(main|master|develop|feature|bugfix|hotfix)/[\w-]+\b",
-            "repository": r"\b(github\.com|gitlab\.com|bitbucket\.org)/[\w-]+/[\w-]+\b",
-            "git_commands": r"\b(git add|git commit|git push|git pull|git merge|git branch)\b",
-        }
+        self.git_patterns = _GIT_PATTERNS
 
     def process_memory(self, memory: Memory) -> Memory:
         """Extract Git information from memory content."""
@@ -34,7 +46,7 @@ class GitPlugin(BasePlugin):
         # Extract Git-related information
         git_data = {}
         for key, pattern in self.git_patterns.items():
-            matches = re.findall(pattern, memory.content, re.IGNORECASE)
+            matches = pattern.findall(memory.content)
             if matches:
                 git_data[key] = list(set(matches))
 
@@ -65,10 +77,5 @@ class GitPlugin(BasePlugin):
     def get_plugin_info(self) -> Dict[str, Any]:
         """Get plugin information."""
         info = super().get_plugin_info()
-        info.update(
-            {
-                "git_patterns": len(self.git_patterns),
-                "supported_patterns": list(self.git_patterns.keys()),
-            }
-        )
+        info.update(_GIT_PLUGIN_INFO)
         return info
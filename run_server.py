@@ -4,7 +4,6 @@ Quick start script for the MCP Memory Server
 """
 
 import os
-import subprocess
 import sys
 from pathlib import Path
 
@@ -38,12 +37,11 @@ def main():
     env = os.environ.copy()
     env["PYTHONPATH"] = str(script_dir)
 
+    # Replace this process with the server so signals reach it directly
+    sys.stdout.flush()
     try:
-        # Run the server
-        subprocess.run(["python3", str(server_path)], env=env, check=True)
-    except KeyboardInterrupt:
-        print("\n🛑 Server stopped by user")
-    except subprocess.CalledProcessError as e:
+        os.execve(sys.executable, [sys.executable, str(server_path)], env)
+    except OSError as e:
         print(f"❌ Error running server: {e}")
         sys.exit(1)
 
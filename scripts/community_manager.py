@@ -6,21 +6,134 @@ This script helps manage community engagement, track contributions,
 and generate reports for the open source project.
 """
 
+import asyncio
+import hashlib
 import json
 import os
 import sys
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 
-import requests
+import httpx
 from rich.console import Console
 from rich.panel import Panel
 from rich.progress import track
 from rich.table import Table
+from rich.text import Text
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 console = Console()
 
+# Transient GitHub API failures worth retrying, with exponential backoff
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 0.5
+
+# Stay clear of GitHub's secondary rate limits: cap concurrent requests and
+# wait for the window to reset once few requests remain in it
+MAX_CONCURRENT_REQUESTS = 5
+RATE_LIMIT_RESERVE = 10
+
+# GitHub API responses are reused from disk for this long
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "github"
+CACHE_TTL_SECONDS = 600
+
+# The report only shows a handful of the newest issues and PRs
+RECENT_ITEMS_LIMIT = 5
+RECENTLY_CLOSED_DAYS = 30
+TOP_CONTRIBUTORS = 10
+
+# Labels whose open issue counts are reported, keyed by count name
+INSIGHT_LABELS = {
+    "good_first_issues": "good first issue",
+    "help_wanted_issues": "help wanted",
+}
+
+# One GraphQL query returns the open and closed issues and pull requests;
+# GitHub only serves GraphQL to authenticated clients
+GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_ITEMS = (
+    "(states: {states}, first: {first}, orderBy: {{field: CREATED_AT, direction: DESC}}) "
+    "{{ totalCount nodes {{ number title state createdAt author {{ login }} "
+    "labels(first: 10) {{ nodes {{ name }} }} }} }}"
+)
+REPORT_QUERY = (
+    "query($owner: String!, $name: String!) { "
+    "repository(owner: $owner, name: $name) { "
+    + " ".join(
+        f"{alias}: {connection}" + _GRAPHQL_ITEMS.format(states=states, first=first)
+        for alias, connection, states, first in (
+            ("openIssues", "issues", "OPEN", RECENT_ITEMS_LIMIT),
+            ("closedIssues", "issues", "CLOSED", RECENT_ITEMS_LIMIT),
+            ("openPRs", "pullRequests", "OPEN", RECENT_ITEMS_LIMIT),
+            ("closedPRs", "pullRequests", "[CLOSED, MERGED]", RECENT_ITEMS_LIMIT),
+        )
+    )
+    + "".join(
+        f' {alias}: label(name: "{label}") {{ issues(states: OPEN) {{ totalCount }} }}'
+        for alias, label in INSIGHT_LABELS.items()
+    )
+    + " } }"
+)
+
+# Report table columns as (header, style) pairs
+CONTRIBUTOR_COLUMNS = (
+    ("Rank", "cyan"),
+    ("Username", "green"),
+    ("Contributions", "yellow"),
+    ("Profile", "blue"),
+)
+ISSUE_COLUMNS = (
+    ("Number", "cyan"),
+    ("Title", "green"),
+    ("Author", "yellow"),
+    ("Labels", "blue"),
+    ("Created", "magenta"),
+)
+PR_COLUMNS = (
+    ("Number", "cyan"),
+    ("Title", "green"),
+    ("Author", "yellow"),
+    ("Status", "blue"),
+    ("Created", "magenta"),
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_gh_date(timestamp: str) -> str:
+    """Format a GitHub ISO 8601 UTC timestamp as a YYYY-MM-DD date."""
+    return datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ").strftime("%Y-%m-%d")
+
+
+def _truncate(text: str, width: int = 50) -> str:
+    """Cut text to width characters, marking the cut with an ellipsis."""
+    return text if len(text) <= width else text[:width] + "..."
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _make_table(title: str, columns: Tuple[Tuple[str, str], ...]) -> Table:
+    """Create a table with the given (header, style) columns."""
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
 
 class CommunityManager:
     """Manages community engagement and contribution tracking."""
@@ -31,58 +144,334 @@ class CommunityManager:
         self.repo_name = "mcp-context-manager-python"
         self.api_base = "https://api.github.com"
 
-    def get_github_headers(self) -> Dict[str, str]:
-        """Get headers for GitHub API requests."""
-        headers = {
+        # Endpoint URLs and headers are the same for every request
+        repo_url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}"
+        self.contributors_url = f"{repo_url}/contributors"
+        self.issues_url = f"{repo_url}/issues"
+        self.pulls_url = f"{repo_url}/pulls"
+        self.search_issues_url = f"{self.api_base}/search/issues"
+        self._github_headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "MCP-Context-Manager-Community",
         }
         if self.github_token:
-            headers["Authorization"] = f"token {self.github_token}"
-        return headers
+            self._github_headers["Authorization"] = f"token {self.github_token}"
 
-    def get_contributors(self) -> List[Dict]:
-        """Get list of contributors from GitHub API."""
-        url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}/contributors"
-        response = requests.get(url, headers=self.get_github_headers())
+        # Latest (remaining, reset time) per rate limit resource
+        self._rate_limits: Dict[str, Tuple[int, float]] = {}
+        # Not bound to an event loop until first awaited (Python 3.10+)
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
+    def get_github_headers(self) -> Dict[str, str]:
+        """Get headers for GitHub API requests."""
+        return dict(self._github_headers)
+
+    def _cache_path(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+    ) -> Path:
+        """Get the cache file for a request, keyed by URL, parameters and body."""
+        key = f"{url}?{urlencode(sorted((params or {}).items()))}"
+        if payload is not None:
+            key += json.dumps(payload, sort_keys=True)
+        return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+    def _read_cache(self, cache_path: Path) -> Optional[Dict]:
+        """Read a cached response entry, or None if missing or unreadable."""
+        try:
+            return _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache(
+        self, cache_path: Path, body: Any, etag: Optional[str] = None
+    ) -> None:
+        """Store a response body with its fetch time and ETag."""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"fetched_at": time.time(), "etag": etag, "body": body}, f)
+        os.replace(tmp_path, cache_path)
+
+    async def _request_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        what: str,
+        params: Optional[Dict[str, str]] = None,
+        payload: Optional[Dict[str, Any]] = None,
+        parse: Optional[Callable[[httpx.Response], Any]] = None,
+    ) -> Optional[Any]:
+        """GET (or POST a payload to) the GitHub API, returning None on error."""
+        cache_path = self._cache_path(url, params, payload)
+        cached = self._read_cache(cache_path)
+        if cached and time.time() - cached["fetched_at"] < CACHE_TTL_SECONDS:
+            console.print(f"[dim]Using cached {what}[/dim]")
+            return cached["body"]
+
+        # Revalidate stale entries; a 304 has no body and no rate limit cost
+        headers = {}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        resource = self._rate_limit_resource(url)
+
+        async def send() -> httpx.Response:
+            async with self._request_slots:
+                await self._wait_for_rate_limit(resource)
+                if payload is not None:
+                    response = await client.post(url, json=payload)
+                else:
+                    response = await client.get(url, params=params, headers=headers)
+            self._update_rate_limit(response)
+            return response
+
+        response = await send()
+        for attempt in range(MAX_RETRIES):
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            response = await send()
+
+        if response.status_code == 304 and cached:
+            console.print(f"[dim]Cached {what} not modified[/dim]")
+            self._write_cache(cache_path, cached["body"], cached["etag"])
+            return cached["body"]
+
+        if response.status_code != 200:
+            console.print(f"[red]Error fetching {what}: {response.status_code}[/red]")
+            return None
+
+        body = parse(response) if parse else _json_loads(response.content)
+        # GraphQL reports failures in the body of a 200 response
+        if isinstance(body, dict) and body.get("errors"):
+            console.print(f"[red]Error fetching {what}: {body['errors'][0]}[/red]")
+            return None
+
+        self._write_cache(cache_path, body, response.headers.get("ETag"))
+        return body
+
+    def _rate_limit_resource(self, url: str) -> str:
+        """Get the GitHub rate limit resource a request counts against."""
+        if url == GRAPHQL_URL:
+            return "graphql"
+        if url == self.search_issues_url:
+            return "search"
+        return "core"
+
+    def _update_rate_limit(self, response: httpx.Response) -> None:
+        """Remember the rate limit state reported by a response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None:
+            return
+        resource = response.headers.get("X-RateLimit-Resource", "core")
+        reset = float(response.headers.get("X-RateLimit-Reset", 0))
+        self._rate_limits[resource] = (int(remaining), reset)
+
+    async def _wait_for_rate_limit(self, resource: str) -> None:
+        """Sleep until the rate limit window resets if it is nearly used up."""
+        remaining, reset = self._rate_limits.get(resource, (RATE_LIMIT_RESERVE, 0))
+        delay = reset - time.time()
+        if remaining < RATE_LIMIT_RESERVE and delay > 0:
             console.print(
-                f"[red]Error fetching contributors: {response.status_code}[/red]"
+                f"[yellow]GitHub {resource} rate limit nearly used up, "
+                f"waiting {delay:.0f}s[/yellow]"
             )
-            return []
+            await asyncio.sleep(delay)
+            self._rate_limits.pop(resource, None)
+
+    @staticmethod
+    def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+        """Get the seconds to wait before retrying a response, or None if final."""
+        if response.status_code in (403, 429) and "Retry-After" in response.headers:
+            return float(response.headers["Retry-After"])
+        if response.status_code in RETRY_STATUS_CODES:
+            return RETRY_BACKOFF_SECONDS * 2**attempt
+        return None
+
+    async def _fetch_json(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        what: str,
+        params: Optional[Dict[str, str]] = None,
+    ) -> List[Dict]:
+        """Fetch a JSON list from the GitHub REST API, or an empty list on error."""
+        body = await self._request_json(client, url, what, params)
+        return body if body is not None else []
 
-    def get_issues(
-        self, state: str = "open", labels: Optional[List[str]] = None
+    def _recent_params(self) -> Dict[str, str]:
+        """Request parameters limiting a listing to the few items the report shows."""
+        return {
+            "per_page": str(RECENT_ITEMS_LIMIT),
+            "sort": "created",
+            "direction": "desc",
+        }
+
+    async def get_contributors(self, client: httpx.AsyncClient) -> List[Dict]:
+        """Get the top contributors from GitHub API."""
+        params = {"per_page": str(TOP_CONTRIBUTORS)}
+        return await self._fetch_json(
+            client, self.contributors_url, "contributors", params
+        )
+
+    async def get_contributor_count(self, client: httpx.AsyncClient) -> int:
+        """Count contributors without paging through all of them."""
+        count = await self._request_json(
+            client,
+            self.contributors_url,
+            "contributor count",
+            {"per_page": "1"},
+            parse=self._last_page_number,
+        )
+        return count or 0
+
+    @staticmethod
+    def _last_page_number(response: httpx.Response) -> int:
+        """Read the page count from the Link header, or count the only page."""
+        last = response.links.get("last")
+        if last:
+            return int(httpx.URL(last["url"]).params["page"])
+        return len(_json_loads(response.content))
+
+    async def get_issues(
+        self,
+        client: httpx.AsyncClient,
+        state: str = "open",
+        labels: Optional[List[str]] = None,
     ) -> List[Dict]:
         """Get issues from GitHub API."""
-        url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}/issues"
-        params = {"state": state}
+        params = {"state": state, **self._recent_params()}
         if labels:
             params["labels"] = ",".join(labels)
+        if state == "closed":
+            # Day granularity keeps the URL (and its cache entry) stable all day
+            since = datetime.utcnow().date() - timedelta(days=RECENTLY_CLOSED_DAYS)
+            params["since"] = f"{since.isoformat()}T00:00:00Z"
 
-        response = requests.get(url, headers=self.get_github_headers(), params=params)
+        return await self._fetch_json(client, self.issues_url, "issues", params)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            console.print(f"[red]Error fetching issues: {response.status_code}[/red]")
-            return []
-
-    def get_pull_requests(self, state: str = "open") -> List[Dict]:
+    async def get_pull_requests(
+        self, client: httpx.AsyncClient, state: str = "open"
+    ) -> List[Dict]:
         """Get pull requests from GitHub API."""
-        url = f"{self.api_base}/repos/{self.repo_owner}/{self.repo_name}/pulls"
-        params = {"state": state}
+        params = {"state": state, **self._recent_params()}
+
+        return await self._fetch_json(client, self.pulls_url, "PRs", params)
+
+    async def _search_count(
+        self, client: httpx.AsyncClient, query: str, what: str
+    ) -> int:
+        """Count issues or PRs matching a search query without listing them."""
+        params = {
+            "q": f"repo:{self.repo_owner}/{self.repo_name} {query}",
+            "per_page": "1",
+        }
+        body = await self._request_json(client, self.search_issues_url, what, params)
+        return body["total_count"] if body is not None else 0
 
-        response = requests.get(url, headers=self.get_github_headers(), params=params)
+    async def _count_label(self, client: httpx.AsyncClient, label: str) -> int:
+        """Count open issues carrying a label."""
+        return await self._search_count(
+            client, f'is:issue is:open label:"{label}"', f"{label} count"
+        )
+
+    async def _fetch_issues_and_prs_graphql(
+        self, client: httpx.AsyncClient
+    ) -> Optional[tuple]:
+        """Fetch open/closed issues and PRs and open counts in one GraphQL request."""
+        payload = {
+            "query": REPORT_QUERY,
+            "variables": {"owner": self.repo_owner, "name": self.repo_name},
+        }
+        body = await self._request_json(
+            client, GRAPHQL_URL, "issues and PRs", payload=payload
+        )
+        if body is None:
+            return None
+
+        repository = body["data"]["repository"]
+        counts = {
+            "open_issues": repository["openIssues"]["totalCount"],
+            "open_prs": repository["openPRs"]["totalCount"],
+        }
+        for alias in INSIGHT_LABELS:
+            # label is null when the repository does not define it
+            label = repository[alias]
+            counts[alias] = label["issues"]["totalCount"] if label else 0
+        return (
+            *(
+                [self._from_graphql(node) for node in repository[alias]["nodes"]]
+                for alias in ("openIssues", "closedIssues", "openPRs", "closedPRs")
+            ),
+            counts,
+        )
+
+    @staticmethod
+    def _from_graphql(node: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a GraphQL issue or PR node to the REST shape used for display."""
+        return {
+            "number": node["number"],
+            "title": node["title"],
+            "state": "open" if node["state"] == "OPEN" else "closed",
+            "created_at": node["createdAt"],
+            "user": {"login": (node.get("author") or {}).get("login", "ghost")},
+            "labels": node["labels"]["nodes"],
+        }
+
+    def _create_client(self) -> httpx.AsyncClient:
+        """Create a keep-alive client that reuses connections to the GitHub API."""
+        limits = httpx.Limits(max_connections=10, max_keepalive_connections=4)
+        return httpx.AsyncClient(
+            headers=self.get_github_headers(),
+            transport=httpx.AsyncHTTPTransport(limits=limits, retries=MAX_RETRIES),
+        )
+
+    async def _fetch_issues_and_prs_rest(self, client: httpx.AsyncClient) -> tuple:
+        """Fetch open/closed issues and PRs and open counts with REST calls."""
+        (
+            open_issues,
+            closed_issues,
+            open_prs,
+            closed_prs,
+            open_issue_count,
+            open_pr_count,
+            *label_counts,
+        ) = await asyncio.gather(
+            self.get_issues(client, "open"),
+            self.get_issues(client, "closed"),
+            self.get_pull_requests(client, "open"),
+            self.get_pull_requests(client, "closed"),
+            self._search_count(client, "is:issue is:open", "open issue count"),
+            self._search_count(client, "is:pr is:open", "open PR count"),
+            *(self._count_label(client, label) for label in INSIGHT_LABELS.values()),
+        )
+        counts = {"open_issues": open_issue_count, "open_prs": open_pr_count}
+        counts.update(zip(INSIGHT_LABELS, label_counts))
+        return open_issues, closed_issues, open_prs, closed_prs, counts
+
+    async def _fetch_report_data(self) -> tuple:
+        """Fetch everything the community report needs concurrently."""
+        # Fresh slots, in case an earlier report bound them to another loop
+        self._request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        async with self._create_client() as client:
+            fetch_items = self._fetch_issues_and_prs_rest
+            if self.github_token:
+                fetch_items = self._fetch_issues_and_prs_graphql
+
+            contributors, total_contributors, items = await asyncio.gather(
+                self.get_contributors(client),
+                self.get_contributor_count(client),
+                fetch_items(client),
+            )
+            if items is None:
+                # GraphQL failed: fall back to one REST call per list
+                items = await self._fetch_issues_and_prs_rest(client)
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            console.print(f"[red]Error fetching PRs: {response.status_code}[/red]")
-            return []
+            return (contributors, total_contributors, *items)
 
     def generate_community_report(self) -> None:
         """Generate a comprehensive community report."""
@@ -90,12 +479,17 @@ class CommunityManager:
             Panel.fit("🧠 MCP Context Manager - Community Report", style="bold blue")
         )
 
-        # Get data
-        contributors = self.get_contributors()
-        open_issues = self.get_issues("open")
-        closed_issues = self.get_issues("closed")
-        open_prs = self.get_pull_requests("open")
-        closed_prs = self.get_pull_requests("closed")
+        # Get data (one round trip of wall time instead of five)
+        data = asyncio.run(self._fetch_report_data())
+        (
+            contributors,
+            total_contributors,
+            open_issues,
+            closed_issues,
+            open_prs,
+            closed_prs,
+            counts,
+        ) = data
 
         # Create tables
         self._display_contributors_table(contributors)
@@ -104,22 +498,18 @@ class CommunityManager:
         self._display_prs_table(open_prs, "Open Pull Requests")
 
         # Generate insights
-        self._generate_insights(contributors, open_issues, open_prs)
+        self._generate_insights(contributors, total_contributors, counts)
 
     def _display_contributors_table(self, contributors: List[Dict]) -> None:
         """Display contributors in a table."""
-        table = Table(title="👥 Contributors")
-        table.add_column("Rank", style="cyan")
-        table.add_column("Username", style="green")
-        table.add_column("Contributions", style="yellow")
-        table.add_column("Profile", style="blue")
+        table = _make_table("👥 Contributors", CONTRIBUTOR_COLUMNS)
 
-        for i, contributor in enumerate(contributors[:10], 1):
+        for i, contributor in enumerate(contributors[:TOP_CONTRIBUTORS], 1):
             table.add_row(
                 str(i),
-                contributor["login"],
+                Text(contributor["login"]),
                 str(contributor["contributions"]),
-                contributor["html_url"],
+                Text(contributor["html_url"]),
             )
 
         console.print(table)
@@ -129,26 +519,17 @@ class CommunityManager:
         if not issues:
             return
 
-        table = Table(title=f"📋 {title}")
-        table.add_column("Number", style="cyan")
-        table.add_column("Title", style="green")
-        table.add_column("Author", style="yellow")
-        table.add_column("Labels", style="blue")
-        table.add_column("Created", style="magenta")
+        table = _make_table(f"📋 {title}", ISSUE_COLUMNS)
 
         for issue in issues[:5]:  # Show top 5
             labels = ", ".join([label["name"] for label in issue.get("labels", [])])
-            created = datetime.fromisoformat(issue["created_at"].replace("Z", "+00:00"))
-            created_str = created.strftime("%Y-%m-%d")
 
             table.add_row(
                 f"#{issue['number']}",
-                issue["title"][:50] + "..."
-                if len(issue["title"]) > 50
-                else issue["title"],
-                issue["user"]["login"],
-                labels,
-                created_str,
+                Text(_truncate(issue["title"])),
+                Text(issue["user"]["login"]),
+                Text(labels),
+                _format_gh_date(issue["created_at"]),
             )
 
         console.print(table)
@@ -158,35 +539,29 @@ class CommunityManager:
         if not prs:
             return
 
-        table = Table(title=f"🔀 {title}")
-        table.add_column("Number", style="cyan")
-        table.add_column("Title", style="green")
-        table.add_column("Author", style="yellow")
-        table.add_column("Status", style="blue")
-        table.add_column("Created", style="magenta")
+        table = _make_table(f"🔀 {title}", PR_COLUMNS)
 
         for pr in prs[:5]:  # Show top 5
-            created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-            created_str = created.strftime("%Y-%m-%d")
-
             table.add_row(
                 f"#{pr['number']}",
-                pr["title"][:50] + "..." if len(pr["title"]) > 50 else pr["title"],
-                pr["user"]["login"],
+                Text(_truncate(pr["title"])),
+                Text(pr["user"]["login"]),
                 pr["state"],
-                created_str,
+                _format_gh_date(pr["created_at"]),
             )
 
         console.print(table)
 
     def _generate_insights(
-        self, contributors: List[Dict], issues: List[Dict], prs: List[Dict]
+        self,
+        contributors: List[Dict],
+        total_contributors: int,
+        counts: Dict[str, int],
     ) -> None:
         """Generate community insights."""
         console.print("\n[bold]📊 Community Insights[/bold]")
 
         # Contributor insights
-        total_contributors = len(contributors)
         top_contributor = contributors[0] if contributors else None
 
         console.print(f"👥 Total Contributors: {total_contributors}")
@@ -196,43 +571,32 @@ class CommunityManager:
             )
 
         # Issue insights
-        good_first_issues = [
-            i
-            for i in issues
-            if any(label["name"] == "good first issue" for label in i.get("labels", []))
-        ]
-        help_wanted_issues = [
-            i
-            for i in issues
-            if any(label["name"] == "help wanted" for label in i.get("labels", []))
-        ]
-
-        console.print(f"🎯 Good First Issues: {len(good_first_issues)}")
-        console.print(f"🤝 Help Wanted Issues: {len(help_wanted_issues)}")
-        console.print(f"🔀 Open Pull Requests: {len(prs)}")
+        console.print(f"🎯 Good First Issues: {counts['good_first_issues']}")
+        console.print(f"🤝 Help Wanted Issues: {counts['help_wanted_issues']}")
+        console.print(f"🔀 Open Pull Requests: {counts['open_prs']}")
 
         # Recommendations
-        self._generate_recommendations(contributors, issues, prs)
+        self._generate_recommendations(total_contributors, counts)
 
     def _generate_recommendations(
-        self, contributors: List[Dict], issues: List[Dict], prs: List[Dict]
+        self, total_contributors: int, counts: Dict[str, int]
     ) -> None:
         """Generate recommendations for community growth."""
         console.print("\n[bold]💡 Recommendations[/bold]")
 
-        if len(contributors) < 10:
+        if total_contributors < 10:
             console.print("🌱 Focus on attracting new contributors")
             console.print("   - Create more 'good first issue' labels")
             console.print("   - Improve onboarding documentation")
             console.print("   - Host community events or hackathons")
 
-        if len(prs) > 5:
+        if counts["open_prs"] > 5:
             console.print("⚡ Need more code review capacity")
             console.print("   - Recruit additional maintainers")
             console.print("   - Set up automated review processes")
             console.print("   - Create review guidelines")
 
-        if len(issues) > 20:
+        if counts["open_issues"] > 20:
             console.print("📋 High issue volume - consider triage")
             console.print("   - Set up issue templates")
             console.print("   - Create issue labels for categorization")
@@ -272,11 +636,19 @@ We believe every contribution, no matter how small, makes a difference. Thank yo
         }
 
 
+def _parse_usernames(argument: str) -> List[str]:
+    """Split a comma-separated username argument, ignoring blank entries."""
+    return [name.strip() for name in argument.split(",") if name.strip()]
+
+
 def main():
     """Main function for community management."""
     if len(sys.argv) < 2:
         console.print("[red]Usage: python community_manager.py <command>[/red]")
-        console.print("Commands: report, welcome <username>, track <username>")
+        console.print(
+            "Commands: report, welcome <username>[,<username>...], "
+            "track <username>[,<username>...]"
+        )
         return
 
     command = sys.argv[1]
@@ -285,13 +657,15 @@ def main():
     if command == "report":
         manager.generate_community_report()
     elif command == "welcome" and len(sys.argv) > 2:
-        username = sys.argv[2]
-        welcome_msg = manager.create_welcome_message({"login": username})
-        console.print(Panel(welcome_msg, title="Welcome Message"))
+        for username in _parse_usernames(sys.argv[2]):
+            welcome_msg = manager.create_welcome_message({"login": username})
+            console.print(Panel(welcome_msg, title="Welcome Message"))
     elif command == "track" and len(sys.argv) > 2:
-        username = sys.argv[2]
-        journey = manager.track_contributor_journey(username)
-        console.print(Panel(json.dumps(journey, indent=2), title="Contributor Journey"))
+        for username in _parse_usernames(sys.argv[2]):
+            journey = manager.track_contributor_journey(username)
+            console.print(
+                Panel(json.dumps(journey, indent=2), title="Contributor Journey")
+            )
     else:
         console.print("[red]Invalid command or missing arguments[/red]")
 
@@ -5,10 +5,14 @@ Provides quick access to common development tasks in the organized project struc
 """
 
 import os
+import shlex
 import subprocess
 import sys
+from itertools import islice
 from pathlib import Path
 
+SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__", ".mypy_cache"}
+
 
 def print_header(title):
     print(f"\n{'='*50}")
@@ -20,15 +24,37 @@ def run_command(cmd, description):
     print(f"\n🔄 {description}")
     print(f"Running: {cmd}")
     try:
-        result = subprocess.run(
-            cmd, shell=True, check=True, capture_output=True, text=True
+        # Stream output as it is produced instead of buffering it all
+        process = subprocess.Popen(
+            shlex.split(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
         )
-        print(f"✅ Success: {result.stdout}")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Error: {e.stderr}")
+    except OSError as e:
+        print(f"❌ Error: {e}")
         return False
 
+    with process:
+        for line in process.stdout:
+            print(line, end="")
+
+    if process.returncode == 0:
+        print("✅ Success")
+        return True
+    print(f"❌ Error: exit code {process.returncode}")
+    return False
+
+
+def iter_python_files(root="."):
+    """Yield Python files under root without descending into SKIP_DIRS."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath, filename)
+
 
 def main():
     print_header("MCP Context Manager Python - Developer Helper")
@@ -116,9 +142,9 @@ def main():
 
             elif choice == "6":
                 print_header("Project Structure")
-                run_command(
-                    "find . -type f -name '*.py' | head -20", "Showing Python files"
-                )
+                print("\n🔄 Showing Python files")
+                for path in islice(iter_python_files(), 20):
+                    print(path)
 
             elif choice == "7":
                 print("\n👋 Goodbye!")
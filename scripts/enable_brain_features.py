@@ -4,17 +4,153 @@ Brain Features Enablement Script
 Helps users upgrade their existing MCP Context Manager to use brain-like memory features.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
+import os
 import shutil
 import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Enhanced memories are written to the brain database this many at a time
+MIGRATION_BATCH_SIZE = 1000
+
+# Bulk-write settings for the brain database: WAL with NORMAL sync avoids an
+# fsync per commit, and temp data and reads stay in memory
+FAST_WRITE_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+
+BANNER = "🧠 MCP Context Manager - Brain Features Enablement\n" + "=" * 55 + "\n"
+
+NEXT_STEPS_TEMPLATE = "\n".join(
+    (
+        "",
+        "🎉 Brain Features Successfully Enabled!",
+        "=" * 50,
+        "",
+        "📋 Next Steps:",
+        "1. Restart your MCP client (e.g., Cursor)",
+        "2. Try the new brain tools:",
+        "   • search_similar_experiences - Find analogous past work",
+        "   • get_knowledge_graph - Visualize knowledge connections",
+        "   • get_memory_insights - Analyze your knowledge patterns",
+        "   • trace_knowledge_path - Discover learning paths",
+        "",
+        "🔧 Configuration:",
+        "• Backup created at: {backup_dir}",
+        "• Brain database: {brain_db_path}",
+        "• Example config: {project_root}/brain_config_example.py",
+        "",
+        "📚 Documentation:",
+        "• Read BRAIN_MEMORY_SYSTEM_GUIDE.md for detailed usage",
+        "• Check examples/brain_memory_examples.py for code examples",
+        "• Review BRAIN_ARCHITECTURE_SUMMARY.md for technical details",
+        "",
+        "⚠️  Troubleshooting:",
+        "• If issues occur, restore from backup",
+        "• Use --no-brain flag to disable brain features temporarily",
+        "• Check logs in logs/mcp_server.log for detailed error info",
+        "",
+    )
+)
+
+
+# Contents written to brain_config_example.py
+EXAMPLE_CONFIG = '''#!/usr/bin/env python3
+"""
+Example Brain Memory System Configuration
+Customize these settings for your specific needs.
+"""
+
+# Brain System Configuration
+BRAIN_CONFIG = {
+    # Memory limits
+    "short_term_limit": 50,              # Max memories in short-term layer
+    "memory_decay_threshold": 0.1,       # Below this, memory becomes dormant
+    "consolidation_threshold": 10,        # Access count for consolidation
+
+    # Connection management
+    "connection_strength_threshold": 0.3, # Minimum strength for connections
+    "similarity_threshold": 0.7,          # For automatic connection creation
+    "memory_promotion_threshold": 5,      # Access count for layer promotion
+}
+
+# Custom Topic Hierarchy (extend as needed)
+CUSTOM_TOPIC_HIERARCHY = {
+    "YourDomain": [
+        "Subdomain1", "Subdomain2", "Subdomain3"
+    ],
+    "YourFramework": [
+        "Components", "Services", "Models", "Utils"
+    ]
+}
+
+# Custom Skill Hierarchy (extend as needed)
+CUSTOM_SKILL_HIERARCHY = {
+    "YourSkillArea": [
+        "Basic", "Intermediate", "Advanced", "Expert"
+    ]
+}
+
+# Usage example:
+# from brain_config_example import BRAIN_CONFIG, CUSTOM_TOPIC_HIERARCHY
+# brain_system.config.update(BRAIN_CONFIG)
+# brain_system.topic_hierarchy.update(CUSTOM_TOPIC_HIERARCHY)
+'''
+
 
 class BrainFeatureEnabler:
     """Helper to enable brain features in existing MCP Context Manager setup."""
 
+    REQUIRED_FILES = (
+        "src/simple_mcp_server.py",
+        "src/brain_memory_system.py",
+        "src/brain_integration.py",
+        "src/brain_enhanced_mcp_server.py",
+        "config.py",
+    )
+    BACKUP_FILES = (
+        "cursor_integration.json",
+        "config.py",
+        "data/simple_mcp_memory.db",
+        "data/mcp_memory.db",
+    )
+    # Files whose state decides whether a previous run's setup is still current
+    STATE_FILES = REQUIRED_FILES + (
+        "cursor_integration.json",
+        "brain_config_example.py",
+        "data/simple_mcp_memory.db",
+        "data/brain_memory.db",
+        "data/brain_memory.db-wal",
+    )
+    BRAIN_TABLES = frozenset(
+        (
+            "brain_memory_nodes",
+            "brain_memory_connections",
+            "brain_classification_paths",
+            "brain_memory_access_log",
+        )
+    )
+    BRAIN_TOOL_NAMES = frozenset(
+        {
+            "search_similar_experiences",
+            "get_knowledge_graph",
+            "get_memory_insights",
+            "promote_memory_knowledge",
+            "trace_knowledge_path",
+        }
+    )
+
     def __init__(self, project_root: Path = None):
         self.project_root = project_root or Path(__file__).parent.parent
         self.backup_dir = (
@@ -22,31 +158,29 @@ class BrainFeatureEnabler:
             / "backup"
             / f"brain_upgrade_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         )
+        self.brain_db_path = self.project_root / "data" / "brain_memory.db"
+        self.stamp_path = self.project_root / ".brain_enabled"
         self.logger = logging.getLogger(__name__)
 
-        # Setup logging
-        logging.basicConfig(
-            level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
-        )
+        # Created on first use and shared by the database and migration steps
+        self._brain_system = None
+
+        # Directory listings, so each directory is read once per run
+        self._dir_entries = {}
+
+        # Setup logging, unless the importing application already has
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(levelname)s - %(message)s",
+            )
 
     def check_prerequisites(self) -> bool:
         """Check if the project is ready for brain feature upgrade."""
         print("🧠 Checking Prerequisites for Brain Features...")
 
         # Check if core files exist
-        required_files = [
-            "src/simple_mcp_server.py",
-            "src/brain_memory_system.py",
-            "src/brain_integration.py",
-            "src/brain_enhanced_mcp_server.py",
-            "config.py",
-        ]
-
-        missing_files = []
-        for file_path in required_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                missing_files.append(file_path)
+        missing_files = [path for path in self.REQUIRED_FILES if not self._exists(path)]
 
         if missing_files:
             print("❌ Missing required files:")
@@ -59,7 +193,7 @@ class BrainFeatureEnabler:
         # Check database accessibility
         try:
             db_path = self.project_root / "data" / "simple_mcp_memory.db"
-            if db_path.exists():
+            if self._exists("data/simple_mcp_memory.db"):
                 conn = sqlite3.connect(db_path)
                 conn.close()
                 print("✅ Database accessible")
@@ -71,6 +205,24 @@ class BrainFeatureEnabler:
 
         return True
 
+    def _exists(self, relative_path: str) -> bool:
+        """Check whether a project file exists using cached directory listings."""
+        parent, _, name = relative_path.rpartition("/")
+        if parent not in self._dir_entries:
+            try:
+                with os.scandir(self.project_root / parent) as entries:
+                    self._dir_entries[parent] = {entry.name for entry in entries}
+            except (FileNotFoundError, NotADirectoryError):
+                self._dir_entries[parent] = set()
+            except PermissionError:
+                # Unlistable but possibly searchable: probe files directly
+                self._dir_entries[parent] = None
+
+        entries = self._dir_entries[parent]
+        if entries is None:
+            return os.path.exists(self.project_root / relative_path)
+        return name in entries
+
     def create_backup(self):
         """Create backup of current configuration."""
         print("💾 Creating backup of current setup...")
@@ -78,33 +230,55 @@ class BrainFeatureEnabler:
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
         # Backup key files
-        files_to_backup = [
-            "cursor_integration.json",
-            "config.py",
-            "data/simple_mcp_memory.db",
-            "data/mcp_memory.db",
-        ]
-
-        for file_path in files_to_backup:
-            src = self.project_root / file_path
-            if src.exists():
-                dst = self.backup_dir / file_path
-                dst.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(src, dst)
-                print(f"   ✅ Backed up {file_path}")
+        to_backup = [path for path in self.BACKUP_FILES if self._exists(path)]
+        for file_path in to_backup:
+            (self.backup_dir / file_path).parent.mkdir(parents=True, exist_ok=True)
+
+        # Copies are I/O bound, so overlap them (the databases can be large)
+        if to_backup:
+            with ThreadPoolExecutor(max_workers=len(to_backup)) as executor:
+                for file_path in executor.map(self._backup_file, to_backup):
+                    print(f"   ✅ Backed up {file_path}")
 
         print(f"   📁 Backup created at: {self.backup_dir}")
 
-    def update_cursor_integration(self):
+    def _backup_file(self, file_path: str) -> str:
+        """Copy one project file into the backup directory."""
+        src = self.project_root / file_path
+        dst = self.backup_dir / file_path
+        if src.suffix == ".db":
+            self._backup_database(src, dst)
+        else:
+            shutil.copy2(src, dst)
+        return file_path
+
+    def _backup_database(self, src: Path, dst: Path):
+        """Snapshot a SQLite database with the online backup API."""
+        src_conn = sqlite3.connect(src)
+        dst_conn = sqlite3.connect(dst)
+        try:
+            # Consistent even with concurrent writers or an active WAL
+            src_conn.backup(dst_conn)
+            return
+        except sqlite3.DatabaseError as e:
+            self.logger.warning("Could not snapshot %s: %s", src.name, e)
+        finally:
+            src_conn.close()
+            dst_conn.close()
+
+        # Not a readable database: keep a byte-for-byte copy instead
+        shutil.copyfile(src, dst)
+
+    def update_cursor_integration(self) -> bool:
         """Update Cursor integration to use brain-enhanced server."""
         print("🔧 Updating Cursor integration configuration...")
 
         cursor_config_path = self.project_root / "cursor_integration.json"
 
-        if cursor_config_path.exists():
+        if os.path.isfile(cursor_config_path):
             try:
-                with open(cursor_config_path, "r") as f:
-                    config = json.load(f)
+                old_text = cursor_config_path.read_text(encoding="utf-8")
+                config = json.loads(old_text)
 
                 # Update server command to use brain-enhanced server
                 if "mcpServers" in config:
@@ -117,14 +291,17 @@ class BrainFeatureEnabler:
                             server_config["args"] = ["src/brain_enhanced_mcp_server.py"]
                             print(f"   ✅ Updated server: {server_name}")
 
-                # Save updated config
-                with open(cursor_config_path, "w") as f:
-                    json.dump(config, f, indent=2)
-
-                print("   ✅ Cursor integration updated")
+                # Save updated config, skipping the write on re-runs
+                if self._write_if_changed(
+                    cursor_config_path, json.dumps(config, indent=2), old_text
+                ):
+                    print("   ✅ Cursor integration updated")
+                else:
+                    print("   ✅ Cursor integration already up to date")
 
             except Exception as e:
                 print(f"   ❌ Error updating Cursor config: {e}")
+                return False
         else:
             # Create new configuration
             print("   ℹ️  Creating new Cursor integration config...")
@@ -138,93 +315,174 @@ class BrainFeatureEnabler:
                 }
             }
 
-            with open(cursor_config_path, "w") as f:
-                json.dump(config, f, indent=2)
+            cursor_config_path.write_text(
+                json.dumps(config, indent=2), encoding="utf-8", newline="\n"
+            )
 
             print("   ✅ Created Cursor integration config")
 
+        return True
+
+    def _write_if_changed(self, path: Path, text: str, old_text: str = None) -> bool:
+        """Write text to a file unless it already has that content."""
+        if old_text is None:
+            try:
+                old_text = path.read_text(encoding="utf-8")
+            except FileNotFoundError:
+                pass
+        if text == old_text:
+            return False
+        path.write_text(text, encoding="utf-8", newline="\n")
+        return True
+
     def initialize_brain_database(self):
         """Initialize brain database tables."""
         print("🗄️ Initializing brain database...")
 
         try:
-            # Import and initialize brain system to create tables
-            import sys
-
-            sys.path.insert(0, str(self.project_root))
-
-            from src.brain_memory_system import BrainMemorySystem
+            # Re-runs find the tables in place and skip the schema DDL
+            if self._brain_schema_exists():
+                print("   ✅ Brain database already initialized")
+                return
 
-            brain_db_path = self.project_root / "data" / "brain_memory.db"
-            brain_system = BrainMemorySystem(str(brain_db_path))
+            # Initializing the brain system creates its tables
+            self._get_brain_system()
 
             print("   ✅ Brain database initialized")
-            print(f"   📁 Database path: {brain_db_path}")
+            print(f"   📁 Database path: {self.brain_db_path}")
 
         except Exception as e:
             print(f"   ❌ Error initializing brain database: {e}")
             raise
 
-    def migrate_existing_memories(self):
+    def _brain_schema_exists(self) -> bool:
+        """Check whether the brain database already has all brain tables."""
+        if not os.path.isfile(self.brain_db_path):
+            return False
+        conn = sqlite3.connect(self.brain_db_path)
+        try:
+            tables = {
+                name
+                for (name,) in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )
+            }
+        finally:
+            conn.close()
+        return self.BRAIN_TABLES <= tables
+
+    def migrate_existing_memories(self) -> bool:
         """Migrate existing memories to brain system."""
         print("🔄 Migrating existing memories to brain system...")
 
         try:
             simple_db_path = self.project_root / "data" / "simple_mcp_memory.db"
 
-            if not simple_db_path.exists():
+            if not os.path.isfile(simple_db_path):
                 print("   ℹ️  No existing memories to migrate")
-                return
-
-            # Connect to existing database
-            conn = sqlite3.connect(simple_db_path)
-            cursor = conn.cursor()
+                return True
 
-            # Get existing memories
-            cursor.execute("SELECT * FROM memories ORDER BY created_at")
-            existing_memories = cursor.fetchall()
-            conn.close()
+            # Read the existing memories through the brain connection itself
+            conn = self._open_fast_sqlite(self.brain_db_path)
+            try:
+                conn.execute("ATTACH DATABASE ? AS src", (str(simple_db_path),))
+                (memory_count,) = conn.execute(
+                    "SELECT COUNT(*) FROM src.memories"
+                ).fetchone()
+
+                if not memory_count:
+                    print("   ℹ️  No memories found to migrate")
+                    return True
+
+                print(f"   📝 Found {memory_count} memories to enhance")
+
+                brain_system = self._get_brain_system()
+
+                # Let SQLite walk created_at in order instead of sorting
+                with conn:
+                    conn.execute(
+                        "CREATE INDEX IF NOT EXISTS src.idx_memories_created_at "
+                        "ON memories(created_at)"
+                    )
+
+                # Stream existing memories straight into batched brain writes
+                rows = conn.execute(
+                    "SELECT id, content, memory_type, priority, tags, project_id "
+                    "FROM src.memories ORDER BY created_at"
+                )
+                migrated_count = asyncio.run(
+                    self._migrate_rows(brain_system, conn, rows)
+                )
+                conn.execute("DETACH DATABASE src")
+            finally:
+                conn.close()
 
-            if not existing_memories:
-                print("   ℹ️  No memories found to migrate")
-                return
+            print(f"   ✅ Enhanced {migrated_count} memories with brain features")
+            return True
 
-            print(f"   📝 Found {len(existing_memories)} memories to enhance")
+        except Exception as e:
+            print(f"   ❌ Error migrating memories: {e}")
+            return False
 
-            # Initialize brain system for migration
-            import sys
+    def _add_project_to_path(self):
+        """Make the project's src package importable."""
+        project_root = str(self.project_root)
+        if project_root not in sys.path:
+            sys.path.insert(0, project_root)
 
-            sys.path.insert(0, str(self.project_root))
+    def _get_brain_system(self):
+        """Get the brain memory system, creating it on first use."""
+        if self._brain_system is None:
+            self._add_project_to_path()
 
             from src.brain_memory_system import BrainMemorySystem
 
-            brain_db_path = self.project_root / "data" / "brain_memory.db"
-            brain_system = BrainMemorySystem(str(brain_db_path))
-
-            # Migrate memories (this would be done asynchronously in practice)
-            migrated_count = 0
-            for memory in existing_memories:
+            self._brain_system = BrainMemorySystem(str(self.brain_db_path))
+        return self._brain_system
+
+    def _open_fast_sqlite(self, db_path: Path) -> sqlite3.Connection:
+        """Open a SQLite connection tuned for bulk writes."""
+        conn = sqlite3.connect(db_path)
+        conn.executescript(FAST_WRITE_PRAGMAS)
+        return conn
+
+    async def _migrate_rows(self, brain_system, brain_conn, rows) -> int:
+        """Enhance memory rows and write them to the brain database in batches."""
+        migrated_count = 0
+        batch = []
+        # Per-memory detail only at debug level; progress is printed per batch
+        log_each = self.logger.isEnabledFor(logging.DEBUG)
+
+        # One transaction for the whole migration instead of one per memory
+        with brain_conn:
+            for memory_id, content, memory_type, priority, tags, project_id in rows:
                 try:
                     memory_data = {
-                        "content": memory[1],  # content
-                        "memory_type": memory[2],  # memory_type
-                        "project_id": memory[5],  # project_id
-                        "tags": json.loads(memory[4]) if memory[4] else [],  # tags
-                        "priority": memory[3],  # priority
+                        "content": content,
+                        "memory_type": memory_type,
+                        "project_id": project_id,
+                        "tags": json.loads(tags) if tags else [],
+                        "priority": priority,
                     }
+                except ValueError as e:
+                    print(f"   ⚠️  Skipped memory {memory_id}: {e}")
+                    continue
 
-                    # This would typically be done with async/await
-                    # For migration script, we'll skip the full enhancement
-                    print(f"   ✓ Enhanced memory: {memory[0]}")
-                    migrated_count += 1
+                node = await brain_system.build_memory_node(str(memory_id), memory_data)
+                batch.append(node)
+                if log_each:
+                    self.logger.debug("Enhanced memory %s", memory_id)
 
-                except Exception as e:
-                    print(f"   ⚠️  Skipped memory {memory[0]}: {e}")
+                if len(batch) >= MIGRATION_BATCH_SIZE:
+                    brain_system.save_memory_nodes(brain_conn, batch)
+                    migrated_count += len(batch)
+                    batch.clear()
+                    print(f"   ✓ Enhanced {migrated_count} memories so far")
 
-            print(f"   ✅ Enhanced {migrated_count} memories with brain features")
+            brain_system.save_memory_nodes(brain_conn, batch)
+            migrated_count += len(batch)
 
-        except Exception as e:
-            print(f"   ❌ Error migrating memories: {e}")
+        return migrated_count
 
     def create_example_config(self):
         """Create example brain configuration."""
@@ -232,61 +490,17 @@ class BrainFeatureEnabler:
 
         config_path = self.project_root / "brain_config_example.py"
 
-        config_content = '''#!/usr/bin/env python3
-"""
-Example Brain Memory System Configuration
-Customize these settings for your specific needs.
-"""
-
-# Brain System Configuration
-BRAIN_CONFIG = {
-    # Memory limits
-    "short_term_limit": 50,              # Max memories in short-term layer
-    "memory_decay_threshold": 0.1,       # Below this, memory becomes dormant
-    "consolidation_threshold": 10,        # Access count for consolidation
-
-    # Connection management
-    "connection_strength_threshold": 0.3, # Minimum strength for connections
-    "similarity_threshold": 0.7,          # For automatic connection creation
-    "memory_promotion_threshold": 5,      # Access count for layer promotion
-}
-
-# Custom Topic Hierarchy (extend as needed)
-CUSTOM_TOPIC_HIERARCHY = {
-    "YourDomain": [
-        "Subdomain1", "Subdomain2", "Subdomain3"
-    ],
-    "YourFramework": [
-        "Components", "Services", "Models", "Utils"
-    ]
-}
-
-# Custom Skill Hierarchy (extend as needed)
-CUSTOM_SKILL_HIERARCHY = {
-    "YourSkillArea": [
-        "Basic", "Intermediate", "Advanced", "Expert"
-    ]
-}
-
-# Usage example:
-# from brain_config_example import BRAIN_CONFIG, CUSTOM_TOPIC_HIERARCHY
-# brain_system.config.update(BRAIN_CONFIG)
-# brain_system.topic_hierarchy.update(CUSTOM_TOPIC_HIERARCHY)
-'''
-
-        with open(config_path, "w") as f:
-            f.write(config_content)
-
-        print(f"   ✅ Created example config: {config_path}")
+        if self._write_if_changed(config_path, EXAMPLE_CONFIG):
+            print(f"   ✅ Created example config: {config_path}")
+        else:
+            print(f"   ✅ Example config already up to date: {config_path}")
 
     def run_tests(self):
         """Run basic tests to verify brain features work."""
         print("🧪 Running basic brain feature tests...")
 
         try:
-            import sys
-
-            sys.path.insert(0, str(self.project_root))
+            self._add_project_to_path()
 
             from src.brain_enhanced_mcp_server import BrainEnhancedMCPServer
 
@@ -295,19 +509,10 @@ CUSTOM_SKILL_HIERARCHY = {
             tools = server.get_tools()
 
             # Check for brain tools
-            brain_tools = [
-                "search_similar_experiences",
-                "get_knowledge_graph",
-                "get_memory_insights",
-                "promote_memory_knowledge",
-                "trace_knowledge_path",
+            found_brain_tools = [
+                tool["name"] for tool in tools if tool["name"] in self.BRAIN_TOOL_NAMES
             ]
 
-            found_brain_tools = []
-            for tool in tools:
-                if tool["name"] in brain_tools:
-                    found_brain_tools.append(tool["name"])
-
             print(f"   ✅ Brain tools available: {len(found_brain_tools)}")
             for tool in found_brain_tools:
                 print(f"      • {tool}")
@@ -326,36 +531,38 @@ CUSTOM_SKILL_HIERARCHY = {
 
     def print_next_steps(self):
         """Print next steps for the user."""
-        print("\n🎉 Brain Features Successfully Enabled!")
-        print("=" * 50)
-
-        print("\n📋 Next Steps:")
-        print("1. Restart your MCP client (e.g., Cursor)")
-        print("2. Try the new brain tools:")
-        print("   • search_similar_experiences - Find analogous past work")
-        print("   • get_knowledge_graph - Visualize knowledge connections")
-        print("   • get_memory_insights - Analyze your knowledge patterns")
-        print("   • trace_knowledge_path - Discover learning paths")
-
-        print("\n🔧 Configuration:")
-        print(f"• Backup created at: {self.backup_dir}")
-        print(f"• Brain database: {self.project_root}/data/brain_memory.db")
-        print(f"• Example config: {self.project_root}/brain_config_example.py")
-
-        print("\n📚 Documentation:")
-        print("• Read BRAIN_MEMORY_SYSTEM_GUIDE.md for detailed usage")
-        print("• Check examples/brain_memory_examples.py for code examples")
-        print("• Review BRAIN_ARCHITECTURE_SUMMARY.md for technical details")
-
-        print("\n⚠️  Troubleshooting:")
-        print("• If issues occur, restore from backup")
-        print("• Use --no-brain flag to disable brain features temporarily")
-        print("• Check logs in logs/mcp_server.log for detailed error info")
+        sys.stdout.write(
+            NEXT_STEPS_TEMPLATE.format(
+                backup_dir=self.backup_dir,
+                brain_db_path=self.brain_db_path,
+                project_root=self.project_root,
+            )
+        )
+        sys.stdout.flush()
+
+    def _state_hash(self) -> str:
+        """Hash the size and modification time of every STATE_FILES entry."""
+        digest = hashlib.blake2b(digest_size=16)
+        for file_path in self.STATE_FILES:
+            try:
+                stat = os.stat(self.project_root / file_path)
+                state = f"{file_path}:{stat.st_size}:{stat.st_mtime_ns}"
+            except FileNotFoundError:
+                state = f"{file_path}:missing"
+            digest.update(state.encode())
+        return digest.hexdigest()
+
+    def _read_stamp(self):
+        """Read the state hash stored by the last successful run, if any."""
+        try:
+            return self.stamp_path.read_text()
+        except FileNotFoundError:
+            return None
 
     def enable_brain_features(self):
         """Main method to enable brain features."""
-        print("🧠 MCP Context Manager - Brain Features Enablement")
-        print("=" * 55)
+        sys.stdout.write(BANNER)
+        sys.stdout.flush()
 
         try:
             # Step 1: Check prerequisites
@@ -368,21 +575,35 @@ CUSTOM_SKILL_HIERARCHY = {
             # Step 2: Create backup
             self.create_backup()
 
-            # Step 3: Update configurations
-            self.update_cursor_integration()
+            # Nothing changed since the last successful run: skip steps 3-6
+            setup_succeeded = True
+            if self._read_stamp() == self._state_hash():
+                print("⏭️  Setup unchanged since the last run, skipping to tests")
+            else:
+                # Step 3: Update configurations
+                cursor_updated = self.update_cursor_integration()
+
+                # Step 4: Initialize brain database
+                self.initialize_brain_database()
 
-            # Step 4: Initialize brain database
-            self.initialize_brain_database()
+                # Step 5: Migrate existing memories
+                memories_migrated = self.migrate_existing_memories()
 
-            # Step 5: Migrate existing memories
-            self.migrate_existing_memories()
+                # Step 6: Create example config
+                self.create_example_config()
 
-            # Step 6: Create example config
-            self.create_example_config()
+                setup_succeeded = cursor_updated and memories_migrated
 
             # Step 7: Run tests
             self.run_tests()
 
+            # Only a fully successful setup may be skipped on the next run
+            if setup_succeeded:
+                self.stamp_path.write_text(self._state_hash())
+            else:
+                self.stamp_path.unlink(missing_ok=True)
+                print("⚠️  Some setup steps failed; they will run again next time")
+
             # Step 8: Show next steps
             self.print_next_steps()
 
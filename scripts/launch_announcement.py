@@ -7,33 +7,58 @@ and marketing materials for the open source release.
 """
 
 import json
-import os
 import sys
-from datetime import datetime
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, Tuple
 
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
+try:
+    import orjson
 
-console = Console()
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 
-class LaunchAnnouncementGenerator:
-    """Generates launch announcements and marketing materials."""
+# Single-file bundle written by save_announcements(archive=True)
+ARCHIVE_NAME = "launch_materials.zip"
 
-    def __init__(self):
-        self.project_name = "MCP Context Manager with Brain-Enhanced Memory"
-        self.github_url = "https://github.com/yourusername/mcp-context-manager-python"
-        self.docs_url = (
-            "https://github.com/yourusername/mcp-context-manager-python#readme"
-        )
+# Markdown blocks shared by several announcements
+QUICK_START = """```bash
+git clone {github_url}
+cd mcp-context-manager-python
+python -m venv .venv
+source .venv/bin/activate
+pip install -r requirements.txt
+python src/brain_enhanced_mcp_server.py
+```"""
 
-    def generate_github_announcement(self) -> str:
-        """Generate a GitHub release announcement."""
-        return f"""
-# 🚀 Announcing: {self.project_name}
+CONTRIBUTION_AREAS = """### 🎯 Areas for Contribution
+- **🧠 Brain System Enhancements**: New memory connection types, advanced algorithms
+- **🎨 Visualization & UI**: Web-based knowledge graphs, real-time dashboards
+- **🔌 Integrations**: VS Code extensions, JetBrains plugins, Slack bots
+- **📊 Analytics**: Advanced pattern analysis, learning recommendations
+- **🌍 Accessibility**: Multi-language support, accessibility improvements
+
+### 🏷️ Good First Issues
+We've tagged several issues as `good first issue` for new contributors:
+- Documentation improvements
+- Test coverage enhancements
+- Small bug fixes
+- Performance optimizations"""
+
+RECOGNITION = """We believe in recognizing and celebrating contributions:
+- **First Contribution Badge**: Special recognition for first-time contributors
+- **README Credits**: All contributors listed in acknowledgments
+- **Release Notes**: Major contributions highlighted in releases
+- **Maintainer Invitation**: Active contributors invited to be maintainers"""
+
+# Announcement templates; besides the generator's fields, {quick_start},
+# {contribution_areas} and {recognition} splice in the shared blocks above
+GITHUB_ANNOUNCEMENT_TEMPLATE = """
+# 🚀 Announcing: {project_name}
 
 We're excited to announce the open source release of the **MCP Context Manager with Brain-Enhanced Memory** - a sophisticated Model Context Protocol (MCP) server that provides human brain-like memory management for AI agents.
 
@@ -62,47 +87,24 @@ This isn't just another memory system. We've built something that mimics how the
 
 ## 🚀 Quick Start
 
-```bash
-git clone {self.github_url}
-cd mcp-context-manager-python
-python -m venv .venv
-source .venv/bin/activate
-pip install -r requirements.txt
-python src/brain_enhanced_mcp_server.py
-```
+{quick_start}
 
 ## 🤝 We Need Your Help!
 
 This is just the beginning. We're looking for contributors to help us build the future of AI memory management:
 
-### 🎯 Areas for Contribution
-- **🧠 Brain System Enhancements**: New memory connection types, advanced algorithms
-- **🎨 Visualization & UI**: Web-based knowledge graphs, real-time dashboards
-- **🔌 Integrations**: VS Code extensions, JetBrains plugins, Slack bots
-- **📊 Analytics**: Advanced pattern analysis, learning recommendations
-- **🌍 Accessibility**: Multi-language support, accessibility improvements
-
-### 🏷️ Good First Issues
-We've tagged several issues as `good first issue` for new contributors:
-- Documentation improvements
-- Test coverage enhancements
-- Small bug fixes
-- Performance optimizations
+{contribution_areas}
 
 ## 📚 Resources
 
-- **[Documentation]({self.docs_url})**: Comprehensive guides and examples
-- **[Contributing Guide]({self.github_url}/blob/main/CONTRIBUTING.md)**: How to get started
-- **[Discussions]({self.github_url}/discussions)**: Join the conversation
-- **[Issues]({self.github_url}/issues)**: Report bugs and request features
+- **[Documentation]({docs_url})**: Comprehensive guides and examples
+- **[Contributing Guide]({github_url}/blob/main/CONTRIBUTING.md)**: How to get started
+- **[Discussions]({github_url}/discussions)**: Join the conversation
+- **[Issues]({github_url}/issues)**: Report bugs and request features
 
 ## 🎉 Recognition
 
-We believe in recognizing and celebrating contributions:
-- **First Contribution Badge**: Special recognition for first-time contributors
-- **README Credits**: All contributors listed in acknowledgments
-- **Release Notes**: Major contributions highlighted in releases
-- **Maintainer Invitation**: Active contributors invited to be maintainers
+{recognition}
 
 ## 🧠 The Vision
 
@@ -110,10 +112,10 @@ We're building more than just a memory system - we're creating the foundation fo
 
 ## 🤝 Join Our Community
 
-- **GitHub**: {self.github_url}
-- **Discussions**: {self.github_url}/discussions
-- **Issues**: {self.github_url}/issues
-- **Contributing**: {self.github_url}/blob/main/CONTRIBUTING.md
+- **GitHub**: {github_url}
+- **Discussions**: {github_url}/discussions
+- **Issues**: {github_url}/issues
+- **Contributing**: {github_url}/blob/main/CONTRIBUTING.md
 
 ---
 
@@ -122,9 +124,8 @@ We're building more than just a memory system - we're creating the foundation fo
 *Built with ❤️ for the AI development community*
 """
 
-    def generate_blog_post(self) -> str:
-        """Generate a blog post for the launch."""
-        return f"""
+
+BLOG_POST_TEMPLATE = """
 # Building the Future of AI Memory: Introducing MCP Context Manager
 
 *How we're creating human brain-like memory systems for AI agents*
@@ -246,21 +247,14 @@ We believe in recognizing and celebrating all contributions:
 
 ## Get Started Today
 
-```bash
-git clone {self.github_url}
-cd mcp-context-manager-python
-python -m venv .venv
-source .venv/bin/activate
-pip install -r requirements.txt
-python src/brain_enhanced_mcp_server.py
-```
+{quick_start}
 
 ## Resources
 
-- **[GitHub Repository]({self.github_url})**: Source code and issues
-- **[Documentation]({self.docs_url})**: Comprehensive guides and examples
-- **[Contributing Guide]({self.github_url}/blob/main/CONTRIBUTING.md)**: How to get involved
-- **[Discussions]({self.github_url}/discussions)**: Join the conversation
+- **[GitHub Repository]({github_url})**: Source code and issues
+- **[Documentation]({docs_url})**: Comprehensive guides and examples
+- **[Contributing Guide]({github_url}/blob/main/CONTRIBUTING.md)**: How to get involved
+- **[Discussions]({github_url}/discussions)**: Join the conversation
 
 ---
 
@@ -269,35 +263,8 @@ python src/brain_enhanced_mcp_server.py
 *What will you build with brain-like memory?*
 """
 
-    def generate_social_media_posts(self) -> Dict[str, str]:
-        """Generate social media posts for different platforms."""
-        posts = {
-            "twitter": [
-                "🧠 Excited to announce the open source release of MCP Context Manager with Brain-Enhanced Memory!",
-                "Transform your AI agent from a simple chatbot into an intelligent partner with human-like memory and reasoning capabilities.",
-                "Built with multilayered memory architecture, neural connections, and knowledge growth - just like the human brain.",
-                "Looking for contributors to help build the future of AI memory management! Check out our good first issues.",
-                "Every contribution, no matter how small, brings us closer to truly intelligent AI systems. Join our community!",
-            ],
-            "linkedin": [
-                "🚀 Announcing the open source release of MCP Context Manager with Brain-Enhanced Memory",
-                "We've built a sophisticated Model Context Protocol (MCP) server that provides human brain-like memory management for AI agents.",
-                "Key features: Multilayered memory architecture, neural connections, knowledge growth, and MCP protocol compliance.",
-                "Looking for contributors in areas like brain system enhancements, visualization, integrations, and analytics.",
-                "Join us in building the future of AI memory management!",
-            ],
-            "reddit": [
-                "🧠 [Open Source] MCP Context Manager with Brain-Enhanced Memory - A sophisticated MCP server that provides human brain-like memory management for AI agents",
-                "Features: Multilayered memory architecture, neural connections, knowledge growth, MCP protocol compliance",
-                "Looking for contributors! Good first issues available for new contributors.",
-                "Built with Python, supports Cursor, VS Code, and other MCP clients.",
-            ],
-        }
-        return posts
 
-    def generate_newsletter_content(self) -> str:
-        """Generate newsletter content for the launch."""
-        return f"""
+NEWSLETTER_TEMPLATE = """
 # 🚀 MCP Context Manager: Open Source Launch
 
 ## What's New
@@ -330,47 +297,24 @@ Traditional AI systems have a fundamental limitation: they don't remember. Each
 
 ## Quick Start
 
-```bash
-git clone {self.github_url}
-cd mcp-context-manager-python
-python -m venv .venv
-source .venv/bin/activate
-pip install -r requirements.txt
-python src/brain_enhanced_mcp_server.py
-```
+{quick_start}
 
 ## We Need Your Help!
 
 This is just the beginning. We're looking for contributors to help us build the future of AI memory management:
 
-### 🎯 Areas for Contribution
-- **🧠 Brain System Enhancements**: New memory connection types, advanced algorithms
-- **🎨 Visualization & UI**: Web-based knowledge graphs, real-time dashboards
-- **🔌 Integrations**: VS Code extensions, JetBrains plugins, Slack bots
-- **📊 Analytics**: Advanced pattern analysis, learning recommendations
-- **🌍 Accessibility**: Multi-language support, accessibility improvements
-
-### 🏷️ Good First Issues
-We've tagged several issues as `good first issue` for new contributors:
-- Documentation improvements
-- Test coverage enhancements
-- Small bug fixes
-- Performance optimizations
+{contribution_areas}
 
 ## Recognition & Rewards
 
-We believe in recognizing and celebrating contributions:
-- **First Contribution Badge**: Special recognition for first-time contributors
-- **README Credits**: All contributors listed in acknowledgments
-- **Release Notes**: Major contributions highlighted in releases
-- **Maintainer Invitation**: Active contributors invited to be maintainers
+{recognition}
 
 ## Resources
 
-- **[GitHub Repository]({self.github_url})**: Source code and issues
-- **[Documentation]({self.docs_url})**: Comprehensive guides and examples
-- **[Contributing Guide]({self.github_url}/blob/main/CONTRIBUTING.md)**: How to get started
-- **[Discussions]({self.github_url}/discussions)**: Join the conversation
+- **[GitHub Repository]({github_url})**: Source code and issues
+- **[Documentation]({docs_url})**: Comprehensive guides and examples
+- **[Contributing Guide]({github_url}/blob/main/CONTRIBUTING.md)**: How to get started
+- **[Discussions]({github_url}/discussions)**: Join the conversation
 
 ## The Vision
 
@@ -383,65 +327,173 @@ We're building more than just a memory system - we're creating the foundation fo
 *What will you build with brain-like memory?*
 """
 
-    def save_announcements(self, output_dir: str = "launch_materials") -> None:
-        """Save all announcement materials to files."""
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
 
-        # Save GitHub announcement
-        github_announcement = self.generate_github_announcement()
-        with open(output_path / "github_announcement.md", "w") as f:
-            f.write(github_announcement)
+# Social media posts per platform; they do not depend on the generator fields
+SOCIAL_MEDIA_POSTS = {
+    "twitter": (
+        "🧠 Excited to announce the open source release of MCP Context Manager with Brain-Enhanced Memory!",
+        "Transform your AI agent from a simple chatbot into an intelligent partner with human-like memory and reasoning capabilities.",
+        "Built with multilayered memory architecture, neural connections, and knowledge growth - just like the human brain.",
+        "Looking for contributors to help build the future of AI memory management! Check out our good first issues.",
+        "Every contribution, no matter how small, brings us closer to truly intelligent AI systems. Join our community!",
+    ),
+    "linkedin": (
+        "🚀 Announcing the open source release of MCP Context Manager with Brain-Enhanced Memory",
+        "We've built a sophisticated Model Context Protocol (MCP) server that provides human brain-like memory management for AI agents.",
+        "Key features: Multilayered memory architecture, neural connections, knowledge growth, and MCP protocol compliance.",
+        "Looking for contributors in areas like brain system enhancements, visualization, integrations, and analytics.",
+        "Join us in building the future of AI memory management!",
+    ),
+    "reddit": (
+        "🧠 [Open Source] MCP Context Manager with Brain-Enhanced Memory - A sophisticated MCP server that provides human brain-like memory management for AI agents",
+        "Features: Multilayered memory architecture, neural connections, knowledge growth, MCP protocol compliance",
+        "Looking for contributors! Good first issues available for new contributors.",
+        "Built with Python, supports Cursor, VS Code, and other MCP clients.",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _render(template: str, project_name: str, github_url: str, docs_url: str) -> str:
+    """Fill a template's project name, URL and shared block placeholders."""
+    context = {
+        "project_name": project_name,
+        "github_url": github_url,
+        "docs_url": docs_url,
+        "contribution_areas": CONTRIBUTION_AREAS,
+        "recognition": RECOGNITION,
+    }
+    context["quick_start"] = QUICK_START.format_map(context)
+    return template.format_map(context)
+
+
+@lru_cache(maxsize=None)
+def _get_console():
+    """Create the rich console on first use, so importing this module stays light."""
+    from rich.console import Console
+
+    return Console()
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _print_document(title: str, text: str) -> None:
+    """Print a long document under a rule, skipping rich markup and highlighting."""
+    # Redirected output (e.g. > file.md) gets the plain document without rich
+    if not sys.stdout.isatty():
+        sys.stdout.write(text)
+        return
+
+    console = _get_console()
+    console.rule(title)
+    console.print(text, markup=False, highlight=False)
+
+
+class LaunchAnnouncementGenerator:
+    """Generates launch announcements and marketing materials."""
+
+    def __init__(self):
+        self.project_name = "MCP Context Manager with Brain-Enhanced Memory"
+        self.github_url = "https://github.com/yourusername/mcp-context-manager-python"
+        self.docs_url = (
+            "https://github.com/yourusername/mcp-context-manager-python#readme"
+        )
+
+        # The announcements only depend on the fields above: render them once
+        context = (self.project_name, self.github_url, self.docs_url)
+        self._github = _render(GITHUB_ANNOUNCEMENT_TEMPLATE, *context)
+        self._blog = _render(BLOG_POST_TEMPLATE, *context)
+        self._newsletter = _render(NEWSLETTER_TEMPLATE, *context)
 
-        # Save blog post
-        blog_post = self.generate_blog_post()
-        with open(output_path / "blog_post.md", "w") as f:
-            f.write(blog_post)
+    def generate_github_announcement(self) -> str:
+        """Generate a GitHub release announcement."""
+        return self._github
+
+    def generate_blog_post(self) -> str:
+        """Generate a blog post for the launch."""
+        return self._blog
+
+    def generate_social_media_posts(self) -> Dict[str, Tuple[str, ...]]:
+        """Return the social media posts for each platform (shared, do not mutate)."""
+        return SOCIAL_MEDIA_POSTS
+
+    def generate_newsletter_content(self) -> str:
+        """Generate newsletter content for the launch."""
+        return self._newsletter
 
-        # Save newsletter content
-        newsletter = self.generate_newsletter_content()
-        with open(output_path / "newsletter.md", "w") as f:
-            f.write(newsletter)
+    def save_announcements(
+        self, output_dir: str = "launch_materials", archive: bool = False
+    ) -> None:
+        """Save all announcement materials to files, or to one zip archive."""
+        output_path = Path(output_dir)
+        output_path.mkdir(exist_ok=True)
 
-        # Save social media posts
-        social_posts = self.generate_social_media_posts()
-        with open(output_path / "social_media_posts.json", "w") as f:
-            json.dump(social_posts, f, indent=2)
+        files = {
+            "github_announcement.md": self.generate_github_announcement().encode(),
+            "blog_post.md": self.generate_blog_post().encode(),
+            "newsletter.md": self.generate_newsletter_content().encode(),
+            "social_media_posts.json": _json_dumps(self.generate_social_media_posts()),
+        }
 
-        console.print(f"[green]✅ Launch materials saved to {output_path}[/green]")
-        console.print(f"[blue]📁 Files created:[/blue]")
-        console.print(f"  - github_announcement.md")
-        console.print(f"  - blog_post.md")
-        console.print(f"  - newsletter.md")
-        console.print(f"  - social_media_posts.json")
+        console = _get_console()
+        if archive:
+            archive_path = output_path / ARCHIVE_NAME
+            with zipfile.ZipFile(
+                archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=3
+            ) as bundle:
+                for name, data in files.items():
+                    bundle.writestr(name, data)
+            console.print(f"[green]✅ Launch materials saved to {archive_path}[/green]")
+        else:
+            # The writes are independent, so let them run side by side
+            with ThreadPoolExecutor(max_workers=len(files)) as executor:
+                writes = [
+                    executor.submit((output_path / name).write_bytes, data)
+                    for name, data in files.items()
+                ]
+            for write in writes:
+                write.result()
+            console.print(f"[green]✅ Launch materials saved to {output_path}[/green]")
+        console.print("[blue]📁 Files created:[/blue]")
+        for name in files:
+            console.print(f"  - {name}")
 
 
 def main():
     """Main function for launch announcement generation."""
+    console = _get_console()
     if len(sys.argv) < 2:
         console.print("[red]Usage: python launch_announcement.py <command>[/red]")
-        console.print("Commands: github, blog, social, newsletter, all")
+        console.print("Commands: github, blog, social, newsletter, all [--zip]")
         return
 
     command = sys.argv[1]
     generator = LaunchAnnouncementGenerator()
 
-    if command == "github":
-        announcement = generator.generate_github_announcement()
-        console.print(Panel(announcement, title="GitHub Announcement"))
-    elif command == "blog":
-        blog_post = generator.generate_blog_post()
-        console.print(Panel(blog_post, title="Blog Post"))
-    elif command == "social":
-        posts = generator.generate_social_media_posts()
-        console.print(Panel(json.dumps(posts, indent=2), title="Social Media Posts"))
-    elif command == "newsletter":
-        newsletter = generator.generate_newsletter_content()
-        console.print(Panel(newsletter, title="Newsletter Content"))
-    elif command == "all":
-        generator.save_announcements()
-    else:
+    commands = {
+        "github": lambda: _print_document(
+            "GitHub Announcement", generator.generate_github_announcement()
+        ),
+        "blog": lambda: _print_document("Blog Post", generator.generate_blog_post()),
+        "social": lambda: _print_document(
+            "Social Media Posts",
+            _json_dumps(generator.generate_social_media_posts()).decode("utf-8"),
+        ),
+        "newsletter": lambda: _print_document(
+            "Newsletter Content", generator.generate_newsletter_content()
+        ),
+        "all": lambda: generator.save_announcements(archive="--zip" in sys.argv[2:]),
+    }
+    handler = commands.get(command)
+    if handler is None:
         console.print("[red]Invalid command[/red]")
+    else:
+        handler()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,6 @@ after a project has been renamed. It handles both simple and full database types
 import argparse
 import json
 import os
-import shutil
 import sqlite3
 import sys
 from datetime import datetime
@@ -22,6 +21,34 @@ sys.path.insert(0, str(project_root))
 
 from config import Config
 
+# Settings for connections that migrate memories: WAL with NORMAL sync avoids
+# an fsync per commit, and temp data and up to 200 MB of pages stay in memory.
+# WAL mode sticks to the file, so discovery and dry runs never apply these.
+MIGRATION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-200000;
+"""
+
+
+def _open_database(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
+    """Open a read-only SQLite connection, or one tuned for migration writes."""
+    if read_only:
+        return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(MIGRATION_PRAGMAS)
+    return conn
+
+
+def _backup_database(conn: sqlite3.Connection, backup_file: Path) -> None:
+    """Snapshot a live SQLite database with the online backup API."""
+    dst_conn = sqlite3.connect(backup_file)
+    try:
+        conn.backup(dst_conn, pages=1000)
+    finally:
+        dst_conn.close()
+
 
 class MemoryMigrator:
     """Handles migration of memories between project IDs."""
@@ -33,6 +60,45 @@ class MemoryMigrator:
         )
         self.data_dir = Config.DATA_DIR
         self.migration_log = []
+        self._connections: Dict[Tuple[Path, bool], sqlite3.Connection] = {}
+
+    def _get_connection(
+        self, db_path: Path, read_only: bool = False
+    ) -> sqlite3.Connection:
+        """Get a connection to a database, opening it on first use."""
+        key = (db_path, read_only)
+        conn = self._connections.get(key)
+        if conn is None:
+            conn = self._connections[key] = _open_database(db_path, read_only)
+        return conn
+
+    def __enter__(self) -> "MemoryMigrator":
+        """Use the migrator as a context manager that closes its connections."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the database connections."""
+        self.close()
+
+    def close(self) -> None:
+        """Close every database connection opened by the migrator."""
+        for conn in self._connections.values():
+            conn.close()
+        self._connections.clear()
+
+    def _find_project_ids(self, db_path: Path) -> List[str]:
+        """Find the other project IDs stored in one database."""
+        conn = self._get_connection(db_path, read_only=True)
+        try:
+            cursor = conn.execute(
+                "SELECT DISTINCT project_id FROM memories WHERE project_id != ?",
+                (self.new_project_id,),
+            )
+        except sqlite3.OperationalError as e:
+            if "no such table" in str(e):
+                return []
+            raise
+        return [row[0] for row in cursor]
 
     def discover_old_project_ids(self) -> List[str]:
         """Discover all project IDs in existing databases."""
@@ -42,18 +108,7 @@ class MemoryMigrator:
         simple_db_path = Config.SIMPLE_DB_PATH
         if simple_db_path.exists():
             try:
-                with sqlite3.connect(simple_db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = cursor.fetchall()
-
-                    if any("memories" in table[0].lower() for table in tables):
-                        cursor.execute(
-                            "SELECT DISTINCT project_id FROM memories WHERE project_id != ?",
-                            (self.new_project_id,),
-                        )
-                        old_project_ids.update(row[0] for row in cursor.fetchall())
-
+                old_project_ids.update(self._find_project_ids(simple_db_path))
             except Exception as e:
                 self.migration_log.append(f"Error reading simple database: {e}")
 
@@ -61,18 +116,7 @@ class MemoryMigrator:
         full_db_path = Config.FULL_DB_PATH
         if full_db_path.exists():
             try:
-                with sqlite3.connect(full_db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = cursor.fetchall()
-
-                    if any("memories" in table[0].lower() for table in tables):
-                        cursor.execute(
-                            "SELECT DISTINCT project_id FROM memories WHERE project_id != ?",
-                            (self.new_project_id,),
-                        )
-                        old_project_ids.update(row[0] for row in cursor.fetchall())
-
+                old_project_ids.update(self._find_project_ids(full_db_path))
             except Exception as e:
                 self.migration_log.append(f"Error reading full database: {e}")
 
@@ -83,15 +127,15 @@ class MemoryMigrator:
         try:
             backup_path = Path(self.backup_dir)
             backup_path.mkdir(exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
             # Backup simple database
             simple_db_path = Config.SIMPLE_DB_PATH
             if simple_db_path.exists():
-                backup_file = (
-                    backup_path
-                    / f"simple_mcp_memory_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+                backup_file = backup_path / f"simple_mcp_memory_backup_{timestamp}.db"
+                _backup_database(
+                    self._get_connection(simple_db_path, read_only=True), backup_file
                 )
-                shutil.copy2(simple_db_path, backup_file)
                 self.migration_log.append(
                     f"Backed up simple database to: {backup_file}"
                 )
@@ -99,11 +143,10 @@ class MemoryMigrator:
             # Backup full database
             full_db_path = Config.FULL_DB_PATH
             if full_db_path.exists():
-                backup_file = (
-                    backup_path
-                    / f"mcp_memory_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+                backup_file = backup_path / f"mcp_memory_backup_{timestamp}.db"
+                _backup_database(
+                    self._get_connection(full_db_path, read_only=True), backup_file
                 )
-                shutil.copy2(full_db_path, backup_file)
                 self.migration_log.append(f"Backed up full database to: {backup_file}")
 
             return True
@@ -122,46 +165,32 @@ class MemoryMigrator:
             return migration_stats
 
         try:
-            with sqlite3.connect(simple_db_path) as conn:
+            with self._get_connection(simple_db_path) as conn:
                 cursor = conn.cursor()
 
+                # One write transaction for every project ID; the connection's
+                # context manager rolls it back if the migration fails
+                cursor.execute("BEGIN IMMEDIATE")
+                # Lets each per-project copy find its rows through an index
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_memories_project_id "
+                    "ON memories(project_id)"
+                )
                 for old_project_id in old_project_ids:
-                    # Get memories for this project ID (simple schema)
+                    # Copy the memories with the new project ID inside SQLite
+                    # (simple schema), skipping memories that already exist
                     cursor.execute(
                         """
-                        SELECT id, content, memory_type, priority, tags, project_id, created_at
+                        INSERT OR IGNORE INTO memories (
+                            content, memory_type, priority, tags, project_id, created_at
+                        )
+                        SELECT content, memory_type, priority, tags, ?, created_at
                         FROM memories
                         WHERE project_id = ?
                     """,
-                        (old_project_id,),
+                        (self.new_project_id, old_project_id),
                     )
-
-                    memories = cursor.fetchall()
-                    migrated_count = 0
-
-                    for memory in memories:
-                        try:
-                            # Insert with new project ID (simple schema)
-                            cursor.execute(
-                                """
-                                INSERT INTO memories (
-                                    content, memory_type, priority, tags, project_id, created_at
-                                ) VALUES (?, ?, ?, ?, ?, ?)
-                            """,
-                                (
-                                    memory[1],
-                                    memory[2],
-                                    memory[3],
-                                    memory[4],
-                                    self.new_project_id,
-                                    memory[6],
-                                ),
-                            )
-                            migrated_count += 1
-
-                        except sqlite3.IntegrityError:
-                            # Memory already exists with new project ID, skip
-                            continue
+                    migrated_count = cursor.rowcount
 
                     migration_stats[old_project_id] = migrated_count
                     self.migration_log.append(
@@ -185,58 +214,36 @@ class MemoryMigrator:
             return migration_stats
 
         try:
-            with sqlite3.connect(full_db_path) as conn:
+            with self._get_connection(full_db_path) as conn:
                 cursor = conn.cursor()
 
+                # One write transaction for every project ID; the connection's
+                # context manager rolls it back if the migration fails
+                cursor.execute("BEGIN IMMEDIATE")
+                # Lets each per-project copy find its rows through an index
+                cursor.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_memories_project_id "
+                    "ON memories(project_id)"
+                )
                 for old_project_id in old_project_ids:
-                    # Get memories for this project ID
+                    # Copy the memories with the new project ID inside SQLite,
+                    # skipping memories that already exist
                     cursor.execute(
                         """
-                        SELECT id, agent_id, content, memory_type, priority, tags,
-                               custom_metadata, embedding, similarity_score, is_short_term,
-                               is_deleted, created_at, updated_at
+                        INSERT OR IGNORE INTO memories (
+                            id, agent_id, project_id, content, memory_type, priority,
+                            tags, custom_metadata, embedding, similarity_score,
+                            is_short_term, is_deleted, created_at, updated_at
+                        )
+                        SELECT id, agent_id, ?, content, memory_type, priority,
+                               tags, custom_metadata, embedding, similarity_score,
+                               is_short_term, is_deleted, created_at, updated_at
                         FROM memories
                         WHERE project_id = ?
                     """,
-                        (old_project_id,),
+                        (self.new_project_id, old_project_id),
                     )
-
-                    memories = cursor.fetchall()
-                    migrated_count = 0
-
-                    for memory in memories:
-                        try:
-                            # Insert with new project ID
-                            cursor.execute(
-                                """
-                                INSERT INTO memories (
-                                    id, agent_id, project_id, content, memory_type, priority,
-                                    tags, custom_metadata, embedding, similarity_score,
-                                    is_short_term, is_deleted, created_at, updated_at
-                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                                (
-                                    memory[0],
-                                    memory[1],
-                                    self.new_project_id,
-                                    memory[2],
-                                    memory[3],
-                                    memory[4],
-                                    memory[5],
-                                    memory[6],
-                                    memory[7],
-                                    memory[8],
-                                    memory[9],
-                                    memory[10],
-                                    memory[11],
-                                    memory[12],
-                                ),
-                            )
-                            migrated_count += 1
-
-                        except sqlite3.IntegrityError:
-                            # Memory already exists with new project ID, skip
-                            continue
+                    migrated_count = cursor.rowcount
 
                     migration_stats[old_project_id] = migrated_count
                     self.migration_log.append(
@@ -256,7 +263,7 @@ class MemoryMigrator:
             # Check simple database
             simple_db_path = Config.SIMPLE_DB_PATH
             if simple_db_path.exists():
-                with sqlite3.connect(simple_db_path) as conn:
+                with self._get_connection(simple_db_path, read_only=True) as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         "SELECT COUNT(*) FROM memories WHERE project_id = ?",
@@ -270,7 +277,7 @@ class MemoryMigrator:
             # Check full database
             full_db_path = Config.FULL_DB_PATH
             if full_db_path.exists():
-                with sqlite3.connect(full_db_path) as conn:
+                with self._get_connection(full_db_path, read_only=True) as conn:
                     cursor = conn.cursor()
                     cursor.execute(
                         "SELECT COUNT(*) FROM memories WHERE project_id = ?",
@@ -382,29 +389,28 @@ def main():
     # Ensure data directory exists
     Config.ensure_directories()
 
-    migrator = MemoryMigrator(args.new_project_id, args.backup_dir)
-
-    if args.discover_only:
-        old_project_ids = migrator.discover_old_project_ids()
-        if old_project_ids:
-            print(f"Found {len(old_project_ids)} old project IDs:")
-            for project_id in old_project_ids:
-                print(f"  - {project_id}")
+    with MemoryMigrator(args.new_project_id, args.backup_dir) as migrator:
+        if args.discover_only:
+            old_project_ids = migrator.discover_old_project_ids()
+            if old_project_ids:
+                print(f"Found {len(old_project_ids)} old project IDs:")
+                for project_id in old_project_ids:
+                    print(f"  - {project_id}")
+            else:
+                print("No old project IDs found")
+            return
+
+        success = migrator.run_migration(dry_run=args.dry_run)
+
+        if success:
+            print("\n✅ Migration completed successfully!")
+            if not args.dry_run:
+                print(
+                    "🔄 You may need to restart your MCP server for changes to take effect"
+                )
         else:
-            print("No old project IDs found")
-        return
-
-    success = migrator.run_migration(dry_run=args.dry_run)
-
-    if success:
-        print("\n✅ Migration completed successfully!")
-        if not args.dry_run:
-            print(
-                "🔄 You may need to restart your MCP server for changes to take effect"
-            )
-    else:
-        print("\n❌ Migration failed!")
-        sys.exit(1)
+            print("\n❌ Migration failed!")
+            sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -14,6 +14,25 @@ sys.path.insert(0, str(project_root))
 
 from config import Config
 
+# Settings for connections that write the migration: WAL with NORMAL sync
+# avoids an fsync per commit, and temp data and up to 200 MB of pages stay in
+# memory. WAL mode sticks to the file, so read-only connections skip these.
+MIGRATION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-200000;
+"""
+
+
+def _open_database(db_path: Path, read_only: bool = False) -> sqlite3.Connection:
+    """Open a read-only SQLite connection, or one tuned for migration writes."""
+    if read_only:
+        return sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(MIGRATION_PRAGMAS)
+    return conn
+
 
 def migrate_memories():
     """Migrate memories from old system to brain extension."""
@@ -29,7 +48,7 @@ def migrate_memories():
 
     try:
         # Connect to source database
-        source_conn = sqlite3.connect(source_db)
+        source_conn = _open_database(source_db, read_only=True)
         source_cursor = source_conn.cursor()
 
         # Check if memories table exists and has data
@@ -60,7 +79,7 @@ def migrate_memories():
         memories = source_cursor.fetchall()
 
         # Connect to target database (same file, but ensure new structure)
-        target_conn = sqlite3.connect(target_db)
+        target_conn = _open_database(target_db)
         target_cursor = target_conn.cursor()
 
         # Ensure target tables exist
@@ -174,49 +193,53 @@ def migrate_memories():
 
 def create_brain_synapses(cursor):
     """Create brain synapses between related memories."""
-    # Get all memories
-    cursor.execute("SELECT id, content, tags FROM memories WHERE is_deleted = FALSE")
-    memories = cursor.fetchall()
-
-    synapse_count = 0
-    for i, (memory_id, content, tags) in enumerate(memories):
-        # Find related memories based on tags
+    # Parse every memory's tags once into a temporary (memory, tag) table
+    cursor.execute("SELECT id, tags FROM memories WHERE is_deleted = FALSE")
+    memory_tags = []
+    for memory_id, tags in cursor.fetchall():
         if tags and tags != "[]":
             try:
                 tags_list = json.loads(tags)
-                for tag in tags_list:
-                    # Find other memories with similar tags
-                    cursor.execute(
-                        """
-                        SELECT id FROM memories
-                        WHERE id != ? AND tags LIKE ? AND is_deleted = FALSE
-                        LIMIT 3
-                    """,
-                        (memory_id, f"%{tag}%"),
-                    )
-
-                    related_memories = cursor.fetchall()
-                    for (related_memory_id,) in related_memories:
-                        # Check if synapse already exists
-                        cursor.execute(
-                            """
-                            SELECT id FROM brain_synapses
-                            WHERE memory_id = ? AND related_memory_id = ?
-                        """,
-                            (memory_id, related_memory_id),
-                        )
-
-                        if not cursor.fetchone():
-                            cursor.execute(
-                                """
-                                INSERT INTO brain_synapses (memory_id, related_memory_id, synapse_strength, synapse_type)
-                                VALUES (?, ?, ?, ?)
-                            """,
-                                (memory_id, related_memory_id, 0.8, "tag_association"),
-                            )
-                            synapse_count += 1
             except json.JSONDecodeError:
                 continue
+            if isinstance(tags_list, list):
+                memory_tags.extend(
+                    (memory_id, tag) for tag in {str(tag) for tag in tags_list}
+                )
+
+    cursor.execute(
+        "CREATE TEMP TABLE IF NOT EXISTS memory_tags (memory_id INTEGER, tag TEXT)"
+    )
+    cursor.execute("DELETE FROM memory_tags")
+    cursor.executemany("INSERT INTO memory_tags VALUES (?, ?)", memory_tags)
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS temp.idx_memory_tags ON memory_tags(tag, memory_id)"
+    )
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_brain_synapses_pair "
+        "ON brain_synapses(memory_id, related_memory_id)"
+    )
+
+    # Link each memory to the first three other memories sharing each tag
+    cursor.execute(
+        """
+        INSERT INTO brain_synapses (memory_id, related_memory_id, synapse_strength, synapse_type)
+        SELECT DISTINCT a.memory_id, b.memory_id, 0.8, 'tag_association'
+        FROM memory_tags a
+        JOIN memory_tags b ON b.rowid IN (
+            SELECT rowid FROM memory_tags
+            WHERE tag = a.tag AND memory_id != a.memory_id
+            ORDER BY memory_id
+            LIMIT 3
+        )
+        WHERE NOT EXISTS (
+            SELECT 1 FROM brain_synapses s
+            WHERE s.memory_id = a.memory_id AND s.related_memory_id = b.memory_id
+        )
+    """
+    )
+    synapse_count = cursor.rowcount
+    cursor.execute("DROP TABLE memory_tags")
 
     print(f"🔗 Created {synapse_count} brain synapses")
 
@@ -228,7 +251,7 @@ def test_brain_extension():
     db_path = Config.SIMPLE_DB_PATH
 
     try:
-        conn = sqlite3.connect(db_path)
+        conn = _open_database(db_path, read_only=True)
         cursor = conn.cursor()
 
         # Test memory retrieval
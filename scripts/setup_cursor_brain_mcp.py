@@ -109,10 +109,16 @@ class CursorBrainMCPSetup:
             "config.py",
         ]
 
+        # One directory scan per parent instead of a stat per file
+        entries_by_dir = {}
         missing_files = []
         for file_path in required_files:
-            full_path = self.project_root / file_path
-            if not full_path.exists():
+            parent, _, name = file_path.rpartition("/")
+            if parent not in entries_by_dir:
+                entries_by_dir[parent] = self._directory_entries(
+                    self.project_root / parent
+                )
+            if name not in entries_by_dir[parent]:
                 missing_files.append(file_path)
             else:
                 print(f"   ✅ {file_path}")
@@ -130,6 +136,15 @@ class CursorBrainMCPSetup:
         print("   ✅ All required files found")
         return True
 
+    @staticmethod
+    def _directory_entries(directory: Path) -> set:
+        """Return the entry names in a directory, or an empty set if missing."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            return set()
+
     def test_brain_server_imports(self):
         """Test if the brain-enhanced MCP server can be imported."""
         print("🧠 Testing brain-enhanced MCP server imports...")
@@ -240,9 +255,13 @@ class CursorBrainMCPSetup:
 
                 existing_config["mcpServers"].update(config["mcpServers"])
 
-                # Write updated config
-                with open(config_path, "w") as f:
+                # Write updated config without ever leaving it half-written
+                tmp_path = config_path.with_name(f"{config_path.name}.tmp")
+                with open(tmp_path, "w") as f:
                     json.dump(existing_config, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, config_path)
 
                 print(f"   ✅ Installed to: {config_path}")
                 successful_paths.append(str(config_path))
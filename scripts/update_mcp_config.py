@@ -10,6 +10,16 @@ from pathlib import Path
 from src.project_detector import detect_project_name, sanitize_project_name
 
 
+def write_json_atomic(path: Path, data, indent: int = 4):
+    """Write JSON via a temporary file so the target is never left truncated."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=indent)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
 def update_mcp_config():
     """Update the MCP configuration with the detected project name."""
 
@@ -51,8 +61,7 @@ def update_mcp_config():
         return
 
     # Write updated config
-    with open(cursor_config_path, "w") as f:
-        json.dump(config, f, indent=4)
+    write_json_atomic(cursor_config_path, config)
 
     print(f"✅ MCP configuration updated successfully!")
     print(f"📁 Project: {project_name}")
@@ -27,6 +27,24 @@ class PromptType(Enum):
     GENERAL = "general"
 
 
+# Patterns used when analyzing context summaries
+_PRIORITY_PATTERN = re.compile(r"\[(HIGH|MEDIUM|LOW)\]")
+_TOPIC_PATTERNS = [
+    re.compile(r"Tags: ([^,\n]+)"),
+    re.compile(r"\*\*([^*]+)\*\*:"),
+    re.compile(r"🎯 Key Priorities:"),
+    re.compile(r"📋 Context Summary"),
+]
+
+# Keyword groups matched against lowercased context summaries and messages
+_PROBLEM_KEYWORDS = ("error", "bug", "issue", "problem", "fix")
+_CODE_KEYWORDS = ("code", "implementation", "function", "class")
+_TECH_KEYWORDS = ("python", "javascript", "react", "mcp", "sql", "api", "docker")
+_QUESTION_KEYWORDS = ("explain", "how", "what", "why")
+_FIX_KEYWORDS = ("fix", "error", "bug", "problem")
+_TASK_KEYWORDS = ("implement", "create", "build", "code")
+
+
 @dataclass
 class PromptContext:
     """Context information for prompt crafting."""
@@ -139,33 +157,20 @@ class AIPromptCrafter:
 
         # Analyze context summary
         if context_summary:
-            analysis["has_tasks"] = "task" in context_summary.lower()
+            summary_lower = context_summary.lower()
+            analysis["has_tasks"] = "task" in summary_lower
             analysis["has_problems"] = any(
-                word in context_summary.lower()
-                for word in ["error", "bug", "issue", "problem", "fix"]
-            )
-            analysis["has_code"] = any(
-                word in context_summary.lower()
-                for word in ["code", "implementation", "function", "class"]
+                word in summary_lower for word in _PROBLEM_KEYWORDS
             )
+            analysis["has_code"] = any(word in summary_lower for word in _CODE_KEYWORDS)
             analysis["has_questions"] = "?" in context_summary
 
             # Extract priority levels
-            priority_pattern = r"\[(HIGH|MEDIUM|LOW)\]"
-            analysis["priority_levels"] = re.findall(priority_pattern, context_summary)
+            analysis["priority_levels"] = _PRIORITY_PATTERN.findall(context_summary)
 
             # Extract technologies
-            tech_keywords = [
-                "python",
-                "javascript",
-                "react",
-                "mcp",
-                "sql",
-                "api",
-                "docker",
-            ]
             analysis["technologies"] = [
-                tech for tech in tech_keywords if tech in context_summary.lower()
+                tech for tech in _TECH_KEYWORDS if tech in summary_lower
             ]
 
             # Extract key topics
@@ -176,20 +181,12 @@ class AIPromptCrafter:
             analysis["user_intent"] = self._determine_user_intent(user_message)
 
             # Update analysis based on user message
-            if any(
-                word in user_message.lower()
-                for word in ["explain", "how", "what", "why"]
-            ):
+            message_lower = user_message.lower()
+            if any(word in message_lower for word in _QUESTION_KEYWORDS):
                 analysis["has_questions"] = True
-            if any(
-                word in user_message.lower()
-                for word in ["fix", "error", "bug", "problem"]
-            ):
+            if any(word in message_lower for word in _FIX_KEYWORDS):
                 analysis["has_problems"] = True
-            if any(
-                word in user_message.lower()
-                for word in ["implement", "create", "build", "code"]
-            ):
+            if any(word in message_lower for word in _TASK_KEYWORDS):
                 analysis["has_tasks"] = True
 
         return analysis
@@ -199,16 +196,8 @@ class AIPromptCrafter:
         topics = []
 
         # Look for common topic indicators
-        topic_patterns = [
-            r"Tags: ([^,\n]+)",
-            r"\*\*([^*]+)\*\*:",
-            r"🎯 Key Priorities:",
-            r"📋 Context Summary",
-        ]
-
-        for pattern in topic_patterns:
-            matches = re.findall(pattern, context_summary)
-            topics.extend(matches)
+        for pattern in _TOPIC_PATTERNS:
+            topics.extend(pattern.findall(context_summary))
 
         return list(set(topics))  # Remove duplicates
 
@@ -216,13 +205,11 @@ class AIPromptCrafter:
         """Determine user intent from message."""
         message_lower = user_message.lower()
 
-        if any(word in message_lower for word in ["explain", "how", "what", "why"]):
+        if any(word in message_lower for word in _QUESTION_KEYWORDS):
             return "explanation"
-        elif any(word in message_lower for word in ["fix", "error", "bug", "problem"]):
+        elif any(word in message_lower for word in _FIX_KEYWORDS):
             return "problem_solving"
-        elif any(
-            word in message_lower for word in ["implement", "create", "build", "code"]
-        ):
+        elif any(word in message_lower for word in _TASK_KEYWORDS):
             return "task"
         elif any(word in message_lower for word in ["review", "check", "examine"]):
             return "review"
@@ -9,6 +9,7 @@ import asyncio
 import json
 import logging
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 
@@ -17,7 +18,38 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import Config
 from src.brain_integration import BrainIntegration
-from src.simple_mcp_server import SimpleMCPServer
+from src.simple_mcp_server import (
+    JSONRPC_INTERNAL_ERROR,
+    JSONRPC_METHOD_NOT_FOUND,
+    SimpleMCPServer,
+    StdinLineReader,
+    configure_default_executor,
+    format_error_response,
+    format_result_response,
+    result_response_template,
+    use_fast_event_loop,
+    write_message,
+)
+
+INITIALIZE_RESPONSE_TEMPLATE = result_response_template(
+    {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {"tools": {}},
+        "serverInfo": {
+            "name": "brain-enhanced-mcp-memory-server",
+            "version": "1.0.0",
+        },
+    }
+)
+
+# User intent recorded for tool calls; placeholders are filled from the
+# tool arguments
+TOOL_CALL_MESSAGES = {
+    "fetch_memory": "User requested memory retrieval",
+    "get_context_summary": "User requested context summary",
+    "search_similar_experiences": "User searched similar experiences: {query}",
+    "get_knowledge_graph": "User requested knowledge graph for: {center_topic}",
+}
 
 
 class BrainEnhancedMCPServer:
@@ -145,11 +177,18 @@ async def main():
 
     server = BrainEnhancedMCPServer(enable_brain_features=enable_brain)
 
+    # The tool set is fixed once the server is built, so serialize it once
+    tools_list_template = result_response_template({"tools": server.get_tools()})
+
+    configure_default_executor()
+    stdin_reader = StdinLineReader()
+    await stdin_reader.start()
+
     # Handle stdio communication following MCP protocol (same as original)
     while True:
         try:
-            # Read from stdin
-            line = sys.stdin.readline()
+            # Read from stdin without blocking the event loop
+            line = await stdin_reader.readline()
             if not line:
                 break
 
@@ -174,55 +213,24 @@ async def main():
                             server.conversation_recorder.record_user_message(
                                 f"User added memory: {content}"
                             )
-                    elif tool_name == "fetch_memory":
-                        server.conversation_recorder.record_user_message(
-                            "User requested memory retrieval"
-                        )
-                    elif tool_name == "get_context_summary":
-                        server.conversation_recorder.record_user_message(
-                            "User requested context summary"
-                        )
-                    elif tool_name == "search_similar_experiences":
-                        query = arguments.get("query", "")
-                        server.conversation_recorder.record_user_message(
-                            f"User searched similar experiences: {query}"
-                        )
-                    elif tool_name == "get_knowledge_graph":
-                        topic = arguments.get("center_topic", "")
-                        server.conversation_recorder.record_user_message(
-                            f"User requested knowledge graph for: {topic}"
-                        )
                     else:
+                        template = TOOL_CALL_MESSAGES.get(tool_name)
                         server.conversation_recorder.record_user_message(
-                            f"User called tool: {tool_name}"
+                            template.format_map(defaultdict(str, arguments))
+                            if template
+                            else f"User called tool: {tool_name}"
                         )
 
             # Handle different MCP message types (same as original)
             if method == "initialize":
                 # Initialize response
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {"tools": {}},
-                        "serverInfo": {
-                            "name": "brain-enhanced-mcp-memory-server",
-                            "version": "1.0.0",
-                        },
-                    },
-                }
-                print(json.dumps(response), flush=True)
+                write_message(
+                    format_result_response(INITIALIZE_RESPONSE_TEMPLATE, request_id)
+                )
 
             elif method == "tools/list":
                 # List tools response (includes brain tools)
-                tools = server.get_tools()
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"tools": tools},
-                }
-                print(json.dumps(response), flush=True)
+                write_message(format_result_response(tools_list_template, request_id))
 
             elif method == "tools/call":
                 # Call tool response (with brain enhancements)
@@ -240,12 +248,22 @@ async def main():
                         )
 
                 response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-                print(json.dumps(response), flush=True)
+                write_message(json.dumps(response))
 
             elif method == "notifications/cancel":
                 # Handle cancellation
                 response = {"jsonrpc": "2.0", "id": request_id, "result": None}
-                print(json.dumps(response), flush=True)
+                write_message(json.dumps(response))
+
+            elif request_id is not None:
+                # Unknown request (notifications never get a response)
+                write_message(
+                    format_error_response(
+                        request_id,
+                        JSONRPC_METHOD_NOT_FOUND,
+                        f"Method not found: {method}",
+                    )
+                )
 
         except EOFError:
             # End conversation when connection closes
@@ -253,13 +271,18 @@ async def main():
             break
         except Exception as e:
             # Error response
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": request_id if "request_id" in locals() else None,
-                "error": {"code": -32603, "message": str(e)},
-            }
-            print(json.dumps(error_response), flush=True)
+            write_message(
+                format_error_response(
+                    request_id if "request_id" in locals() else None,
+                    JSONRPC_INTERNAL_ERROR,
+                    str(e),
+                )
+            )
+
+    stdin_reader.close()
+    await server.conversation_recorder.shutdown()
 
 
 if __name__ == "__main__":
+    use_fast_event_loop()
     asyncio.run(main())
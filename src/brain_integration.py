@@ -7,6 +7,7 @@ Seamlessly integrates brain-like memory system with existing MCP server function
 import asyncio
 import json
 import logging
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
@@ -20,6 +21,139 @@ from .brain_memory_system import (
     MemoryState,
 )
 
+# Brain-enhanced tool schemas, built once at import time
+BRAIN_TOOLS = (
+    {
+        "name": "search_similar_experiences",
+        "description": "Find similar past experiences and related knowledge using brain-like memory search",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query for finding similar experiences",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier to search within",
+                },
+                "focus_areas": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific areas to focus on (topics, skills, technologies)",
+                },
+                "include_analogies": {
+                    "type": "boolean",
+                    "description": "Include analogical reasoning from similar patterns",
+                },
+            },
+            "required": ["query"],
+        },
+    },
+    {
+        "name": "get_knowledge_graph",
+        "description": "Get interconnected knowledge graph for a topic or project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "center_topic": {
+                    "type": "string",
+                    "description": "Central topic to build graph around",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+                "max_depth": {
+                    "type": "integer",
+                    "description": "Maximum connection depth (default: 2)",
+                },
+                "connection_types": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Types of connections to include",
+                },
+            },
+            "required": ["center_topic"],
+        },
+    },
+    {
+        "name": "get_memory_insights",
+        "description": "Get insights about knowledge patterns, growth, and recommendations",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier for focused insights",
+                },
+                "include_recommendations": {
+                    "type": "boolean",
+                    "description": "Include AI recommendations for knowledge management",
+                },
+            },
+        },
+    },
+    {
+        "name": "promote_memory_knowledge",
+        "description": "Manually promote important memories and update knowledge structures",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "memory_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Memory IDs to promote",
+                },
+                "target_layer": {
+                    "type": "string",
+                    "enum": [
+                        "short_term",
+                        "long_term",
+                        "episodic",
+                        "procedural",
+                        "semantic",
+                    ],
+                    "description": "Target memory layer",
+                },
+                "emotional_weight": {
+                    "type": "number",
+                    "minimum": 0.0,
+                    "maximum": 1.0,
+                    "description": "Importance weight (0.0 to 1.0)",
+                },
+            },
+            "required": ["memory_ids"],
+        },
+    },
+    {
+        "name": "trace_knowledge_path",
+        "description": "Trace how knowledge flows from one concept to another through memory connections",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "from_concept": {
+                    "type": "string",
+                    "description": "Starting concept or memory",
+                },
+                "to_concept": {
+                    "type": "string",
+                    "description": "Target concept or memory",
+                },
+                "max_hops": {
+                    "type": "integer",
+                    "description": "Maximum number of connection hops (default: 5)",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project context for search",
+                },
+            },
+            "required": ["from_concept", "to_concept"],
+        },
+    },
+)
+
 
 class BrainIntegration:
     """
@@ -56,139 +190,7 @@ class BrainIntegration:
             return tools
 
         # Add brain-enhanced tools
-        brain_tools = [
-            {
-                "name": "search_similar_experiences",
-                "description": "Find similar past experiences and related knowledge using brain-like memory search",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query for finding similar experiences",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier to search within",
-                        },
-                        "focus_areas": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Specific areas to focus on (topics, skills, technologies)",
-                        },
-                        "include_analogies": {
-                            "type": "boolean",
-                            "description": "Include analogical reasoning from similar patterns",
-                        },
-                    },
-                    "required": ["query"],
-                },
-            },
-            {
-                "name": "get_knowledge_graph",
-                "description": "Get interconnected knowledge graph for a topic or project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "center_topic": {
-                            "type": "string",
-                            "description": "Central topic to build graph around",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                        "max_depth": {
-                            "type": "integer",
-                            "description": "Maximum connection depth (default: 2)",
-                        },
-                        "connection_types": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Types of connections to include",
-                        },
-                    },
-                    "required": ["center_topic"],
-                },
-            },
-            {
-                "name": "get_memory_insights",
-                "description": "Get insights about knowledge patterns, growth, and recommendations",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier for focused insights",
-                        },
-                        "include_recommendations": {
-                            "type": "boolean",
-                            "description": "Include AI recommendations for knowledge management",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "promote_memory_knowledge",
-                "description": "Manually promote important memories and update knowledge structures",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "memory_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Memory IDs to promote",
-                        },
-                        "target_layer": {
-                            "type": "string",
-                            "enum": [
-                                "short_term",
-                                "long_term",
-                                "episodic",
-                                "procedural",
-                                "semantic",
-                            ],
-                            "description": "Target memory layer",
-                        },
-                        "emotional_weight": {
-                            "type": "number",
-                            "minimum": 0.0,
-                            "maximum": 1.0,
-                            "description": "Importance weight (0.0 to 1.0)",
-                        },
-                    },
-                    "required": ["memory_ids"],
-                },
-            },
-            {
-                "name": "trace_knowledge_path",
-                "description": "Trace how knowledge flows from one concept to another through memory connections",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "from_concept": {
-                            "type": "string",
-                            "description": "Starting concept or memory",
-                        },
-                        "to_concept": {
-                            "type": "string",
-                            "description": "Target concept or memory",
-                        },
-                        "max_hops": {
-                            "type": "integer",
-                            "description": "Maximum number of connection hops (default: 5)",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project context for search",
-                        },
-                    },
-                    "required": ["from_concept", "to_concept"],
-                },
-            },
-        ]
-
-        return tools + brain_tools
+        return tools + list(BRAIN_TOOLS)
 
     async def execute_enhanced_tool(
         self, tool_name: str, arguments: Dict[str, Any]
@@ -760,10 +762,10 @@ class BrainIntegration:
             return [start_id]
 
         visited = set()
-        queue = [(start_id, [start_id])]
+        queue = deque([(start_id, [start_id])])
 
         while queue:
-            current_id, path = queue.pop(0)
+            current_id, path = queue.popleft()
 
             if len(path) > max_hops:
                 continue
@@ -10,12 +10,33 @@ import logging
 import math
 import sqlite3
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize a value for a JSON text column, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse a JSON text column, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
 
 
 class MemoryLayer(str, Enum):
@@ -115,6 +136,20 @@ class MemoryNode:
         default_factory=list
     )  # e.g., ["Development", "Debugging", "React"]
 
+    # (content, lowercased content) cache used by content_lower
+    _content_lower: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def content_lower(self) -> str:
+        """Lowercased content, cached until the content changes."""
+        cached = self._content_lower
+        if cached is None or cached[0] is not self.content:
+            cached = (self.content, self.content.lower())
+            self._content_lower = cached
+        return cached[1]
+
 
 class BrainMemorySystem:
     """
@@ -305,6 +340,21 @@ class BrainMemorySystem:
         Enhance an existing memory with brain-like attributes.
         This integrates with the existing memory system.
         """
+        node = await self.build_memory_node(memory_id, memory_data)
+
+        # Store enhanced memory
+        self.memory_nodes[memory_id] = node
+        await self._save_memory_node(node)
+
+        # Find and create connections
+        await self._auto_create_connections(node)
+
+        return node
+
+    async def build_memory_node(
+        self, memory_id: str, memory_data: Dict[str, Any]
+    ) -> MemoryNode:
+        """Create a classified memory node without storing or connecting it."""
         node = MemoryNode(
             id=memory_id,
             content=memory_data.get("content", ""),
@@ -319,18 +369,11 @@ class BrainMemorySystem:
         await self._determine_memory_layer(node)
         await self._calculate_emotional_weight(node)
 
-        # Store enhanced memory
-        self.memory_nodes[memory_id] = node
-        await self._save_memory_node(node)
-
-        # Find and create connections
-        await self._auto_create_connections(node)
-
         return node
 
     async def _classify_memory(self, node: MemoryNode):
         """Classify memory into hierarchical categories."""
-        content_lower = node.content.lower()
+        content_lower = node.content_lower
         tags_lower = [tag.lower() for tag in node.tags]
 
         # Topic classification
@@ -394,7 +437,7 @@ class BrainMemorySystem:
 
     async def _determine_memory_layer(self, node: MemoryNode):
         """Determine the appropriate memory layer for the node."""
-        content = node.content.lower()
+        content = node.content_lower
         memory_type = node.memory_type.lower()
 
         # Heuristics for layer assignment
@@ -417,7 +460,7 @@ class BrainMemorySystem:
 
     async def _calculate_emotional_weight(self, node: MemoryNode):
         """Calculate emotional/priority weight based on content analysis."""
-        content = node.content.lower()
+        content = node.content_lower
         weight = 0.5  # Base weight
 
         # Priority indicators
@@ -481,19 +524,38 @@ class BrainMemorySystem:
         if not node.embedding:
             return []
 
-        similar = []
-        for memory_id, memory_node in self.memory_nodes.items():
-            if memory_id == node.id or not memory_node.embedding:
-                continue
+        candidates = [
+            (memory_id, memory_node)
+            for memory_id, memory_node in self.memory_nodes.items()
+            if memory_id != node.id and memory_node.embedding
+        ]
+        similarities = self._calculate_similarities(
+            node.embedding, [memory_node for _, memory_node in candidates]
+        )
 
-            similarity = self.embedding_service.calculate_similarity(
-                node.embedding, memory_node.embedding
-            )
+        similar = []
+        for (memory_id, _), similarity in zip(candidates, similarities):
             if similarity > self.config["connection_strength_threshold"]:
                 similar.append((memory_id, similarity))
 
         return sorted(similar, key=lambda x: x[1], reverse=True)[:10]
 
+    def _calculate_similarities(
+        self, embedding: List[float], nodes: List[MemoryNode]
+    ) -> List[float]:
+        """Score memory node embeddings against one embedding, batched if supported."""
+        embeddings = [node.embedding for node in nodes]
+        calculate_batch = getattr(
+            self.embedding_service, "calculate_similarities", None
+        )
+        if calculate_batch is not None:
+            return calculate_batch(embedding, embeddings)
+
+        return [
+            self.embedding_service.calculate_similarity(embedding, other)
+            for other in embeddings
+        ]
+
     async def _find_contextual_memories(self, node: MemoryNode) -> List[str]:
         """Find memories in the same context (project, tags)."""
         contextual = []
@@ -596,7 +658,7 @@ class BrainMemorySystem:
         for memory_id, node in self.memory_nodes.items():
             # Content match
             content_score = 0.0
-            if query_lower in node.content.lower():
+            if query_lower in node.content_lower:
                 content_score = 0.8
 
             # Tag match
@@ -639,15 +701,17 @@ class BrainMemorySystem:
         if not query_embedding:
             return []
 
-        similar = []
-        for memory_id, node in self.memory_nodes.items():
-            if not node.embedding:
-                continue
-
-            similarity = self.embedding_service.calculate_similarity(
-                query_embedding, node.embedding
-            )
+        candidates = [
+            (memory_id, node)
+            for memory_id, node in self.memory_nodes.items()
+            if node.embedding
+        ]
+        similarities = self._calculate_similarities(
+            query_embedding, [node for _, node in candidates]
+        )
 
+        similar = []
+        for (memory_id, node), similarity in zip(candidates, similarities):
             if similarity > 0.5:  # Threshold for similarity
                 # Boost score for episodic memories (experiences)
                 score = similarity
@@ -670,11 +734,11 @@ class BrainMemorySystem:
     ) -> List[Dict[str, Any]]:
         """Search connected knowledge through graph traversal."""
         visited = set()
-        queue = [(m["memory_id"], 0) for m in seed_memories]  # (id, depth)
+        queue = deque((m["memory_id"], 0) for m in seed_memories)  # (id, depth)
         connected = []
 
         while queue:
-            current_id, depth = queue.pop(0)
+            current_id, depth = queue.popleft()
 
             if current_id in visited or depth >= max_depth:
                 continue
@@ -765,10 +829,10 @@ class BrainMemorySystem:
             ):
                 # Determine target layer based on content
                 if node.metadata.memory_layer == MemoryLayer.SHORT_TERM:
-                    if "procedure" in node.content.lower():
+                    if "procedure" in node.content_lower:
                         metadata.memory_layer = MemoryLayer.PROCEDURAL
                     elif any(
-                        word in node.content.lower()
+                        word in node.content_lower
                         for word in ["happened", "did", "was"]
                     ):
                         metadata.memory_layer = MemoryLayer.EPISODIC
@@ -781,9 +845,15 @@ class BrainMemorySystem:
     async def _save_memory_node(self, node: MemoryNode):
         """Save memory node to database."""
         conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        self.save_memory_nodes(conn, [node])
+        conn.commit()
+        conn.close()
 
-        cursor.execute(
+    def save_memory_nodes(
+        self, conn: sqlite3.Connection, nodes: Iterable[MemoryNode]
+    ) -> None:
+        """Write memory nodes with one executemany; the caller commits."""
+        conn.executemany(
             """
             INSERT OR REPLACE INTO brain_memory_nodes (
                 id, memory_layer, memory_state, access_count, last_accessed,
@@ -794,29 +864,29 @@ class BrainMemorySystem:
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
             (
-                node.id,
-                node.metadata.memory_layer.value,
-                node.metadata.memory_state.value,
-                node.metadata.access_count,
-                node.metadata.last_accessed,
-                node.metadata.emotional_weight,
-                node.metadata.integration_depth,
-                node.metadata.decay_rate,
-                node.metadata.reinforcement_count,
-                json.dumps(node.metadata.topic_categories),
-                json.dumps(node.metadata.skill_categories),
-                json.dumps(node.metadata.context_categories),
-                json.dumps(node.topic_path),
-                json.dumps(node.skill_path),
-                node.metadata.connection_strength_total,
-                node.metadata.connected_memory_count,
-                datetime.now(),
+                (
+                    node.id,
+                    node.metadata.memory_layer.value,
+                    node.metadata.memory_state.value,
+                    node.metadata.access_count,
+                    node.metadata.last_accessed,
+                    node.metadata.emotional_weight,
+                    node.metadata.integration_depth,
+                    node.metadata.decay_rate,
+                    node.metadata.reinforcement_count,
+                    _json_dumps(node.metadata.topic_categories),
+                    _json_dumps(node.metadata.skill_categories),
+                    _json_dumps(node.metadata.context_categories),
+                    _json_dumps(node.topic_path),
+                    _json_dumps(node.skill_path),
+                    node.metadata.connection_strength_total,
+                    node.metadata.connected_memory_count,
+                    datetime.now(),
+                )
+                for node in nodes
             ),
         )
 
-        conn.commit()
-        conn.close()
-
     async def _save_connection(self, connection: MemoryConnection):
         """Save memory connection to database."""
         conn = sqlite3.connect(self.db_path)
@@ -839,7 +909,7 @@ class BrainMemorySystem:
                 connection.strength,
                 connection.last_reinforced,
                 connection.reinforcement_count,
-                json.dumps(connection.metadata),
+                _json_dumps(connection.metadata),
             ),
         )
 
@@ -875,13 +945,13 @@ class BrainMemorySystem:
                     reinforcement_count=row[9],
                     memory_layer=MemoryLayer(row[1]),
                     memory_state=MemoryState(row[2]),
-                    topic_categories=json.loads(row[10]) if row[10] else [],
-                    skill_categories=json.loads(row[11]) if row[11] else [],
-                    context_categories=json.loads(row[12]) if row[12] else [],
+                    topic_categories=_json_loads(row[10]) if row[10] else [],
+                    skill_categories=_json_loads(row[11]) if row[11] else [],
+                    context_categories=_json_loads(row[12]) if row[12] else [],
                 )
 
-                node.topic_path = json.loads(row[13]) if row[13] else []
-                node.skill_path = json.loads(row[14]) if row[14] else []
+                node.topic_path = _json_loads(row[13]) if row[13] else []
+                node.skill_path = _json_loads(row[14]) if row[14] else []
 
                 self.memory_nodes[node.id] = node
 
@@ -13,6 +13,20 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# (whole second, ISO string) of the most recently formatted timestamp
+_last_timestamp = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current time as an ISO string, formatted at most once a second."""
+    global _last_timestamp
+    second = int(time.time())
+    cached_second, cached_iso = _last_timestamp
+    if second != cached_second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _last_timestamp = (second, cached_iso)
+    return cached_iso
+
 
 class PerformanceMonitor:
     def __init__(self, db_path: str = "performance_metrics.db"):
@@ -95,17 +109,15 @@ class PerformanceMonitor:
         self.is_monitoring = False
         if self.monitor_thread:
             self.monitor_thread.join()
+        # Persist anything queued after the last tick
+        self._flush_metrics()
         print("📊 Performance monitoring stopped")
 
     def _monitor_loop(self):
         """Background loop for processing metrics."""
         while self.is_monitoring:
             try:
-                # Process metrics from queue
-                while not self.metrics_queue.empty():
-                    metric = self.metrics_queue.get_nowait()
-                    self._store_metric(metric)
-
+                self._flush_metrics()
                 time.sleep(1)  # Check every second
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
@@ -123,7 +135,7 @@ class PerformanceMonitor:
     ):
         """Track a performance event."""
         metric = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "event_type": event_type,
             "project_id": project_id,
             "duration_ms": duration_ms,
@@ -136,29 +148,44 @@ class PerformanceMonitor:
 
         self.metrics_queue.put(metric)
 
-    def _store_metric(self, metric: Dict[str, Any]):
-        """Store a metric in the database."""
+    def _flush_metrics(self):
+        """Store all queued metrics in a single transaction."""
+        metrics = []
+        while True:
+            try:
+                metrics.append(self.metrics_queue.get_nowait())
+            except queue.Empty:
+                break
+
+        if metrics:
+            self._store_metrics(metrics)
+
+    def _store_metrics(self, metrics: List[Dict[str, Any]]):
+        """Store a batch of metrics in the database."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
-        cursor.execute(
+        cursor.executemany(
             """
             INSERT INTO performance_metrics
             (timestamp, event_type, project_id, duration_ms, success,
              error_message, context_length, memory_count, metadata)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
-            (
-                metric["timestamp"],
-                metric["event_type"],
-                metric["project_id"],
-                metric["duration_ms"],
-                metric["success"],
-                metric["error_message"],
-                metric["context_length"],
-                metric["memory_count"],
-                metric["metadata"],
-            ),
+            [
+                (
+                    metric["timestamp"],
+                    metric["event_type"],
+                    metric["project_id"],
+                    metric["duration_ms"],
+                    metric["success"],
+                    metric["error_message"],
+                    metric["context_length"],
+                    metric["memory_count"],
+                    metric["metadata"],
+                )
+                for metric in metrics
+            ],
         )
 
         conn.commit()
@@ -183,7 +210,7 @@ class PerformanceMonitor:
             VALUES (?, ?, ?, ?, ?, ?)
         """,
             (
-                datetime.now().isoformat(),
+                _now_iso(),
                 feedback_type,
                 rating,
                 comment,
@@ -216,7 +243,7 @@ class PerformanceMonitor:
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
             (
-                datetime.now().isoformat(),
+                _now_iso(),
                 user_id,
                 session_id,
                 action_type,
@@ -23,33 +23,32 @@ def detect_project_name(workspace_path: Optional[str] = None) -> str:
 
     workspace = Path(workspace_path)
 
-    # Method 1: Check for pyproject.toml
+    # Method 1: Check for pyproject.toml (a missing file is just another
+    # exception here, so no separate existence check is needed)
     pyproject_path = workspace / "pyproject.toml"
-    if pyproject_path.exists():
-        try:
-            import tomllib
-            from typing import Any
-
-            with open(pyproject_path, "rb") as f:
-                data: dict[str, Any] = tomllib.load(f)
-                if "project" in data and "name" in data["project"]:
-                    return str(data["project"]["name"])
-        except Exception:
-            pass
+    try:
+        import tomllib
+        from typing import Any
+
+        with open(pyproject_path, "rb") as f:
+            data: dict[str, Any] = tomllib.load(f)
+            if "project" in data and "name" in data["project"]:
+                return str(data["project"]["name"])
+    except Exception:
+        pass
 
     # Method 2: Check for package.json
     package_json_path = workspace / "package.json"
-    if package_json_path.exists():
-        try:
-            import json
-            from typing import Any
-
-            with open(package_json_path, "r") as f:
-                data: dict[str, Any] = json.load(f)
-                if "name" in data:
-                    return str(data["name"])
-        except Exception:
-            pass
+    try:
+        import json
+        from typing import Any
+
+        with open(package_json_path, "r") as f:
+            data: dict[str, Any] = json.load(f)
+            if "name" in data:
+                return str(data["name"])
+    except Exception:
+        pass
 
     # Method 3: Use directory name as fallback
     return workspace.name
@@ -10,11 +10,16 @@ import logging
 import os
 import re
 import sqlite3
+import string
 import sys
 import time
-from datetime import datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -24,27 +29,516 @@ from src.ai_prompt_crafter import AIPromptCrafter, PromptContext, PromptType
 from src.performance_monitor import ContextInjectionMonitor, PerformanceMonitor
 from src.project_detector import get_project_id_from_env, sanitize_project_name
 
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+# Technology tags and the keywords that trigger them
+TECH_TAG_KEYWORDS = {
+    "python": ["python", "py", "pip", "venv"],
+    "javascript": ["javascript", "js", "node", "npm"],
+    "typescript": ["typescript", "ts"],
+    "react": ["react", "jsx", "tsx"],
+    "mcp": ["mcp", "memory", "context"],
+    "database": ["database", "sql", "sqlite", "postgres", "mysql"],
+    "api": ["api", "rest", "http", "endpoint"],
+    "testing": ["test", "testing", "unit", "integration"],
+    "deployment": ["deploy", "docker", "kubernetes", "aws", "azure"],
+}
+
+# Reverse index from each keyword to the tag it triggers
+TAG_KEYWORD_INDEX = {
+    keyword: tag for tag, keywords in TECH_TAG_KEYWORDS.items() for keyword in keywords
+}
+
+# Keywords only match whole tokens, so "py" does not tag "happy"
+_TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+_TOKEN_CHARS = frozenset(string.ascii_lowercase + string.digits + "_")
+
+# Recent classification decisions kept per classifier; tool hooks record the
+# same short messages over and over
+CLASSIFICATION_CACHE_SIZE = 1024
+
+# Messages with more words than this are tagged as "detailed"
+DETAILED_WORD_COUNT = 20
+
+# Short messages and responses that are never worth recording
+_TRIVIAL_MESSAGES = frozenset(
+    {
+        # Greetings
+        "hello",
+        "hi",
+        "hey",
+        "thanks",
+        "thank you",
+        # Confirmations
+        "ok",
+        "okay",
+        "yes",
+        "no",
+        "yep",
+        "nope",
+        "sure",
+    }
+)
+_TRIVIAL_RESPONSES = frozenset(("ok", "okay", "got it", "understood", "sure"))
+
+# Keyword groups used to classify auto-recorded memories
+_TASK_KEYWORDS = (
+    "implement",
+    "create",
+    "build",
+    "add",
+    "fix",
+    "update",
+    "refactor",
+    "write",
+    "code",
+)
+_PREFERENCE_KEYWORDS = (
+    "prefer",
+    "like",
+    "want",
+    "need",
+    "should",
+    "must",
+    "always",
+    "never",
+)
+_FACT_KEYWORDS = (
+    "is",
+    "are",
+    "was",
+    "were",
+    "has",
+    "have",
+    "does",
+    "do",
+    "explain",
+    "describe",
+)
+_HIGH_PRIORITY_KEYWORDS = (
+    "urgent",
+    "critical",
+    "important",
+    "must",
+    "need",
+    "error",
+    "bug",
+    "fix",
+    "broken",
+)
+_MEDIUM_PRIORITY_KEYWORDS = (
+    "should",
+    "would",
+    "could",
+    "implement",
+    "create",
+    "add",
+    "update",
+)
+
+# JSON-RPC error codes
+JSONRPC_METHOD_NOT_FOUND = -32601
+JSONRPC_INTERNAL_ERROR = -32603
+
+# Pre-serialized error envelopes; only the request id and message vary
+_ERROR_RESPONSE_TEMPLATES = {
+    code: f'{{"jsonrpc": "2.0", "id": %s, "error": {{"code": {code}, "message": %s}}}}'
+    for code in (JSONRPC_METHOD_NOT_FOUND, JSONRPC_INTERNAL_ERROR)
+}
+
+
+def format_error_response(request_id: Any, code: int, message: str) -> str:
+    """Serialize a JSON-RPC error response from its precomputed template."""
+    return _ERROR_RESPONSE_TEMPLATES[code] % (
+        json.dumps(request_id),
+        json.dumps(message),
+    )
+
+
+def result_response_template(result: Dict[str, Any]) -> str:
+    """Pre-serialize a constant JSON-RPC result, leaving a slot for the id."""
+    serialized = json.dumps(result).replace("%", "%%")
+    return '{"jsonrpc": "2.0", "id": %s, "result": ' + serialized + "}"
+
+
+def format_result_response(template: str, request_id: Any) -> str:
+    """Fill the request id into a pre-serialized result response."""
+    return template % json.dumps(request_id)
+
+
+INITIALIZE_RESPONSE_TEMPLATE = result_response_template(
+    {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {"tools": {}},
+        "serverInfo": {
+            "name": "simple-mcp-memory-server",
+            "version": "0.1.0",
+        },
+    }
+)
+
+
+# Tool schemas advertised over MCP, built once at import time
+MCP_TOOLS = (
+    {
+        "name": "push_memory",
+        "description": "Push a memory entry to the server",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "content": {
+                    "type": "string",
+                    "description": "The memory content to store",
+                },
+                "memory_type": {
+                    "type": "string",
+                    "enum": ["fact", "preference", "task", "thread"],
+                    "description": "Type of memory entry",
+                },
+                "priority": {
+                    "type": "string",
+                    "enum": ["low", "medium", "high", "critical"],
+                    "description": "Priority level of the memory",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Tags for categorization",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+            },
+            "required": ["content"],
+        },
+    },
+    {
+        "name": "fetch_memory",
+        "description": "Fetch memories based on search criteria",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Search query for semantic search",
+                },
+                "tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Filter by tags",
+                },
+                "memory_type": {
+                    "type": "string",
+                    "enum": ["fact", "preference", "task", "thread"],
+                    "description": "Filter by memory type",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of results",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+            },
+        },
+    },
+    {
+        "name": "get_agent_stats",
+        "description": "Get statistics for an agent",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "agent_id": {
+                    "type": "string",
+                    "description": "Agent identifier",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+            },
+            "required": ["agent_id"],
+        },
+    },
+    {
+        "name": "register_agent",
+        "description": "Register a new agent",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string", "description": "Agent name"},
+                "agent_type": {
+                    "type": "string",
+                    "enum": ["chatbot", "cli", "web", "mobile", "other"],
+                    "description": "Type of agent",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+            },
+            "required": ["name"],
+        },
+    },
+    {
+        "name": "get_context_summary",
+        "description": "Generate a context summary for chat session injection",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier to summarize context for",
+                },
+                "max_memories": {
+                    "type": "integer",
+                    "description": "Maximum number of memories to include in summary",
+                },
+                "include_recent": {
+                    "type": "boolean",
+                    "description": "Include recent memories in summary",
+                },
+                "focus_areas": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific areas to focus on in summary",
+                },
+            },
+        },
+    },
+    {
+        "name": "auto_inject_context",
+        "description": "Automatically inject context for new conversation sessions",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier (auto-detected if not provided)",
+                },
+                "max_memories": {
+                    "type": "integer",
+                    "description": "Maximum number of memories to include",
+                },
+                "include_recent": {
+                    "type": "boolean",
+                    "description": "Include recent memories",
+                },
+                "use_ai_crafting": {
+                    "type": "boolean",
+                    "description": "Use AI prompt crafting for intelligent context",
+                },
+                "show_notification": {
+                    "type": "boolean",
+                    "description": "Show injection notification",
+                },
+            },
+        },
+    },
+    {
+        "name": "start_conversation_recording",
+        "description": "Start automatic conversation recording for a project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier to record conversations for",
+                },
+                "auto_record_user_messages": {
+                    "type": "boolean",
+                    "description": "Automatically record user messages",
+                },
+                "auto_record_ai_responses": {
+                    "type": "boolean",
+                    "description": "Automatically record AI responses",
+                },
+            },
+        },
+    },
+    {
+        "name": "stop_conversation_recording",
+        "description": "Stop automatic conversation recording and create summary",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                }
+            },
+        },
+    },
+    {
+        "name": "get_performance_report",
+        "description": "Get performance metrics and recommendations",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "days": {
+                    "type": "integer",
+                    "description": "Number of days to analyze (default: 7)",
+                },
+                "include_recommendations": {
+                    "type": "boolean",
+                    "description": "Include AI recommendations (default: true)",
+                },
+            },
+        },
+    },
+    {
+        "name": "record_feedback",
+        "description": "Record user feedback about context injection",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "rating": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 5,
+                    "description": "User rating (1-5)",
+                },
+                "comment": {
+                    "type": "string",
+                    "description": "Optional feedback comment",
+                },
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+                "context_summary": {
+                    "type": "string",
+                    "description": "Context summary that was provided",
+                },
+            },
+            "required": ["rating"],
+        },
+    },
+    {
+        "name": "craft_ai_prompt",
+        "description": "Craft an intelligent AI prompt using context summary and user input",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": {
+                    "type": "string",
+                    "description": "Project identifier",
+                },
+                "user_message": {
+                    "type": "string",
+                    "description": "User message to incorporate into the prompt",
+                },
+                "prompt_type": {
+                    "type": "string",
+                    "enum": [
+                        "continuation",
+                        "task_focused",
+                        "problem_solving",
+                        "explanation",
+                        "code_review",
+                        "debugging",
+                        "general",
+                    ],
+                    "description": "Type of prompt to craft",
+                },
+                "focus_areas": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Specific areas to focus on",
+                },
+            },
+            "required": ["project_id"],
+        },
+    },
+)
+
+
+# User intent recorded for tool calls, keyed by tool name
+TOOL_CALL_MESSAGES = {
+    "fetch_memory": "User requested memory retrieval",
+    "get_context_summary": "User requested context summary",
+    "get_agent_stats": "User requested agent statistics",
+    "craft_ai_prompt": "User requested AI prompt crafting",
+}
+
+TOOLS_LIST_RESPONSE_TEMPLATE = result_response_template({"tools": list(MCP_TOOLS)})
+
+
+@dataclass(slots=True)
+class ConversationEntry:
+    """A single recorded interaction in the conversation buffer."""
+
+    type: str  # "user" or "ai"
+    content: str
+    timestamp: int  # time.monotonic_ns() when recorded
+
+    def recorded_at(self) -> datetime:
+        """Convert the monotonic timestamp to wall-clock time."""
+        elapsed_ns = time.monotonic_ns() - self.timestamp
+        return datetime.now() - timedelta(microseconds=elapsed_ns // 1000)
+
 
 class ConversationRecorder:
     """Automatically records conversation interactions for memory storage."""
 
+    # Shared Aho-Corasick automaton for tag extraction, built on first use
+    _tag_automaton = None
+
     def __init__(self, memory_server):
         self.memory_server = memory_server
-        self.conversation_buffer = []
+        self.max_buffer_size = Config.CONVERSATION_BUFFER_SIZE
+        self.conversation_buffer = deque(maxlen=self.max_buffer_size)
         self.last_user_message = ""
         self.last_ai_response = ""
         self.conversation_start_time = None
+        self._reset_statistics()
         # Detect project ID dynamically
         detected_project = get_project_id_from_env()
         self.project_id = sanitize_project_name(detected_project)
         self.auto_record_user = True
         self.auto_record_ai = True
+        # Auto-recorded memories are written by a single background worker
+        self._memory_queue = None
+        self._memory_worker = None
+        if AHOCORASICK_AVAILABLE and ConversationRecorder._tag_automaton is None:
+            ConversationRecorder._tag_automaton = self._build_tag_automaton()
+
+    @staticmethod
+    def _build_tag_automaton():
+        """Build an automaton that finds every tag keyword in a single pass."""
+        automaton = ahocorasick.Automaton()
+        for keyword, tag in TAG_KEYWORD_INDEX.items():
+            automaton.add_word(keyword, (len(keyword), tag))
+        automaton.make_automaton()
+        return automaton
+
+    def _reset_statistics(self):
+        """Reset the running per-conversation message statistics."""
+        self.user_message_count = 0
+        self.ai_response_count = 0
+        self.longest_user_message = ""
+        self.longest_ai_response = ""
 
     def start_conversation(self, project_id: str = "workspace"):
         """Start tracking a new conversation."""
         self.conversation_start_time = datetime.now()
         self.project_id = project_id
-        self.conversation_buffer = []
+        self.conversation_buffer = deque(maxlen=self.max_buffer_size)
+        self._reset_statistics()
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Started conversation tracking for project: {project_id}")
 
@@ -52,70 +546,98 @@ class ConversationRecorder:
         """Record a user message for automatic memory creation."""
         self.last_user_message = message.strip()
         self.conversation_buffer.append(
-            {
-                "type": "user",
-                "content": self.last_user_message,
-                "timestamp": datetime.now(),
-            }
+            ConversationEntry("user", self.last_user_message, time.monotonic_ns())
         )
+        self.user_message_count += 1
+        if len(self.last_user_message) > len(self.longest_user_message):
+            self.longest_user_message = self.last_user_message
 
         # Auto-create memory for significant user messages if enabled
-        if self.auto_record_user and self._is_significant_message(message):
-            asyncio.create_task(self._auto_record_memory("user_message", message))
+        if self.auto_record_user and self._is_significant_message(
+            self.last_user_message
+        ):
+            self._enqueue_memory("user_message", self.last_user_message)
 
     def record_ai_response(self, response: str):
         """Record an AI response for automatic memory creation."""
         self.last_ai_response = response.strip()
         self.conversation_buffer.append(
-            {
-                "type": "ai",
-                "content": self.last_ai_response,
-                "timestamp": datetime.now(),
-            }
+            ConversationEntry("ai", self.last_ai_response, time.monotonic_ns())
         )
+        self.ai_response_count += 1
+        if len(self.last_ai_response) > len(self.longest_ai_response):
+            self.longest_ai_response = self.last_ai_response
 
         # Auto-create memory for significant AI responses if enabled
-        if self.auto_record_ai and self._is_significant_response(response):
-            asyncio.create_task(self._auto_record_memory("ai_response", response))
+        if self.auto_record_ai and self._is_significant_response(self.last_ai_response):
+            self._enqueue_memory("ai_response", self.last_ai_response)
 
-    def _is_significant_message(self, message: str) -> bool:
-        """Determine if a user message is significant enough to record."""
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+    def _is_significant_message(message: str) -> bool:
+        """Determine if a stripped user message is significant enough to record."""
         # Skip very short messages
-        if len(message.strip()) < 10:
+        if len(message) < 10:
             return False
 
-        # Skip simple greetings
-        greetings = ["hello", "hi", "hey", "thanks", "thank you", "ok", "okay"]
-        if message.lower().strip() in greetings:
-            return False
+        # Skip simple greetings and confirmations
+        return message.casefold() not in _TRIVIAL_MESSAGES
 
-        # Skip simple confirmations
-        confirmations = ["yes", "no", "yep", "nope", "sure", "ok", "okay"]
-        if message.lower().strip() in confirmations:
-            return False
-
-        return True
-
-    def _is_significant_response(self, response: str) -> bool:
-        """Determine if an AI response is significant enough to record."""
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+    def _is_significant_response(response: str) -> bool:
+        """Determine if a stripped AI response is significant enough to record."""
         # Skip very short responses
-        if len(response.strip()) < 20:
+        if len(response) < 20:
             return False
 
         # Skip simple acknowledgments
-        acknowledgments = ["ok", "okay", "got it", "understood", "sure"]
-        if response.lower().strip() in acknowledgments:
-            return False
+        return response.casefold() not in _TRIVIAL_RESPONSES
 
-        return True
+    def _enqueue_memory(self, interaction_type: str, content: str):
+        """Queue an interaction for the background memory worker."""
+        if self._memory_worker is None:
+            self._memory_queue = asyncio.Queue(maxsize=Config.MEMORY_QUEUE_SIZE)
+            self._memory_worker = asyncio.create_task(self._memory_worker_loop())
+
+        try:
+            self._memory_queue.put_nowait((interaction_type, content))
+        except asyncio.QueueFull:
+            self.logger.warning(
+                "Memory queue full; dropping %s auto-record", interaction_type
+            )
+
+    async def _memory_worker_loop(self):
+        """Record queued memories one at a time."""
+        while True:
+            interaction_type, content = await self._memory_queue.get()
+            try:
+                await self._auto_record_memory(interaction_type, content)
+            finally:
+                self._memory_queue.task_done()
+
+    async def shutdown(self):
+        """Flush pending auto-recorded memories and stop the worker."""
+        if self._memory_worker is None:
+            return
+
+        await self._memory_queue.join()
+        self._memory_worker.cancel()
+        try:
+            await self._memory_worker
+        except asyncio.CancelledError:
+            pass
+        self._memory_queue = None
+        self._memory_worker = None
 
     async def _auto_record_memory(self, interaction_type: str, content: str):
         """Automatically record a memory entry."""
         try:
             # Determine memory type and priority based on content
-            memory_type = self._determine_memory_type(content)
-            priority = self._determine_priority(content)
-            tags = self._extract_tags(content)
+            content_lower = content.casefold()
+            memory_type = self._determine_memory_type(content_lower)
+            priority = self._determine_priority(content_lower)
+            tags = list(self._extract_tags(content_lower))
 
             # Create memory entry
             memory_args = {
@@ -130,142 +652,93 @@ class ConversationRecorder:
             result = await self.memory_server._push_memory(memory_args)
 
             if not result.get("isError", True):
-                self.logger.info(
-                    f"Auto-recorded memory: {memory_type} - {content[:50]}..."
-                )
+                # Skip slicing the content when INFO records are filtered out
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info(
+                        "Auto-recorded memory: %s - %s...", memory_type, content[:50]
+                    )
             else:
-                self.logger.warning(f"Failed to auto-record memory: {result}")
+                self.logger.warning("Failed to auto-record memory: %s", result)
 
         except Exception as e:
-            self.logger.error(f"Error auto-recording memory: {e}")
-
-    def _determine_memory_type(self, content: str) -> str:
-        """Determine the appropriate memory type based on content."""
-        content_lower = content.lower()
+            self.logger.error("Error auto-recording memory: %s", e)
 
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+    def _determine_memory_type(content_lower: str) -> str:
+        """Determine the appropriate memory type based on lowercased content."""
         # Check for task-related content
-        task_keywords = [
-            "implement",
-            "create",
-            "build",
-            "add",
-            "fix",
-            "update",
-            "refactor",
-            "write",
-            "code",
-        ]
-        if any(keyword in content_lower for keyword in task_keywords):
+        if any(keyword in content_lower for keyword in _TASK_KEYWORDS):
             return "task"
 
         # Check for preference-related content
-        preference_keywords = [
-            "prefer",
-            "like",
-            "want",
-            "need",
-            "should",
-            "must",
-            "always",
-            "never",
-        ]
-        if any(keyword in content_lower for keyword in preference_keywords):
+        if any(keyword in content_lower for keyword in _PREFERENCE_KEYWORDS):
             return "preference"
 
         # Check for fact-related content
-        fact_keywords = [
-            "is",
-            "are",
-            "was",
-            "were",
-            "has",
-            "have",
-            "does",
-            "do",
-            "explain",
-            "describe",
-        ]
-        if any(keyword in content_lower for keyword in fact_keywords):
+        if any(keyword in content_lower for keyword in _FACT_KEYWORDS):
             return "fact"
 
         # Default to thread for ongoing conversations
         return "thread"
 
-    def _determine_priority(self, content: str) -> str:
-        """Determine the priority based on content analysis."""
-        content_lower = content.lower()
-
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+    def _determine_priority(content_lower: str) -> str:
+        """Determine the priority based on lowercased content analysis."""
         # High priority keywords
-        high_priority = [
-            "urgent",
-            "critical",
-            "important",
-            "must",
-            "need",
-            "error",
-            "bug",
-            "fix",
-            "broken",
-        ]
-        if any(keyword in content_lower for keyword in high_priority):
+        if any(keyword in content_lower for keyword in _HIGH_PRIORITY_KEYWORDS):
             return "high"
 
         # Medium priority keywords
-        medium_priority = [
-            "should",
-            "would",
-            "could",
-            "implement",
-            "create",
-            "add",
-            "update",
-        ]
-        if any(keyword in content_lower for keyword in medium_priority):
+        if any(keyword in content_lower for keyword in _MEDIUM_PRIORITY_KEYWORDS):
             return "medium"
 
         # Default to low priority
         return "low"
 
-    def _extract_tags(self, content: str) -> List[str]:
-        """Extract relevant tags from content."""
+    @staticmethod
+    @lru_cache(maxsize=CLASSIFICATION_CACHE_SIZE)
+    def _extract_tags(content_lower: str) -> Tuple[str, ...]:
+        """Extract relevant tags from lowercased content."""
         tags = []
-        content_lower = content.lower()
 
         # Technology tags
-        tech_keywords = {
-            "python": ["python", "py", "pip", "venv"],
-            "javascript": ["javascript", "js", "node", "npm"],
-            "typescript": ["typescript", "ts"],
-            "react": ["react", "jsx", "tsx"],
-            "mcp": ["mcp", "memory", "context"],
-            "database": ["database", "sql", "sqlite", "postgres", "mysql"],
-            "api": ["api", "rest", "http", "endpoint"],
-            "testing": ["test", "testing", "unit", "integration"],
-            "deployment": ["deploy", "docker", "kubernetes", "aws", "azure"],
-        }
-
-        for tag, keywords in tech_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
-                tags.append(tag)
+        automaton = ConversationRecorder._tag_automaton
+        if automaton is not None:
+            found = set()
+            last = len(content_lower) - 1
+            for end, (length, tag) in automaton.iter(content_lower):
+                start = end - length + 1
+                if (start == 0 or content_lower[start - 1] not in _TOKEN_CHARS) and (
+                    end == last or content_lower[end + 1] not in _TOKEN_CHARS
+                ):
+                    found.add(tag)
+        else:
+            found = {
+                TAG_KEYWORD_INDEX[token]
+                for token in _TOKEN_PATTERN.findall(content_lower)
+                if token in TAG_KEYWORD_INDEX
+            }
+        tags.extend(tag for tag in TECH_TAG_KEYWORDS if tag in found)
 
         # Add conversation tags
-        if "?" in content:
+        if "?" in content_lower:
             tags.append("question")
-        if "!" in content:
+        if "!" in content_lower:
             tags.append("exclamation")
-        if len(content.split()) > 20:
+        # Stop splitting as soon as the word limit is exceeded
+        if len(content_lower.split(None, DETAILED_WORD_COUNT)) > DETAILED_WORD_COUNT:
             tags.append("detailed")
 
-        return tags
+        return tuple(tags)
 
     def end_conversation(self):
         """End the current conversation and create a summary memory."""
         if self.conversation_buffer:
             # Create a summary of the conversation
             summary = self._create_conversation_summary()
-            asyncio.create_task(
-                self._auto_record_memory("conversation_summary", summary)
-            )
+            self._enqueue_memory("conversation_summary", summary)
 
             self.logger.info(f"Ended conversation tracking. Summary created.")
 
@@ -274,26 +747,19 @@ class ConversationRecorder:
         if not self.conversation_buffer:
             return "Empty conversation"
 
-        user_messages = [
-            msg["content"] for msg in self.conversation_buffer if msg["type"] == "user"
-        ]
-        ai_responses = [
-            msg["content"] for msg in self.conversation_buffer if msg["type"] == "ai"
-        ]
-
         summary_parts = []
 
-        if user_messages:
-            summary_parts.append(f"User messages: {len(user_messages)}")
+        if self.user_message_count:
+            summary_parts.append(f"User messages: {self.user_message_count}")
             # Include the most significant user message
-            longest_user_msg = max(user_messages, key=len)
-            summary_parts.append(f"Key user input: {longest_user_msg[:100]}...")
+            summary_parts.append(
+                f"Key user input: {self.longest_user_message[:100]}..."
+            )
 
-        if ai_responses:
-            summary_parts.append(f"AI responses: {len(ai_responses)}")
+        if self.ai_response_count:
+            summary_parts.append(f"AI responses: {self.ai_response_count}")
             # Include the most significant AI response
-            longest_ai_msg = max(ai_responses, key=len)
-            summary_parts.append(f"Key AI output: {longest_ai_msg[:100]}...")
+            summary_parts.append(f"Key AI output: {self.longest_ai_response[:100]}...")
 
         return " | ".join(summary_parts)
 
@@ -324,6 +790,21 @@ class SimpleMCPServer:
         self.conversation_recorder = ConversationRecorder(self)
         self.conversation_recorder.start_conversation(self.project_id)
 
+        # Tool name -> handler, used by execute_tool
+        self._tool_handlers = {
+            "push_memory": self._push_memory,
+            "fetch_memory": self._fetch_memory,
+            "get_agent_stats": self._get_agent_stats,
+            "register_agent": self._register_agent,
+            "get_context_summary": self._get_context_summary,
+            "get_performance_report": self._get_performance_report,
+            "record_feedback": self._record_feedback,
+            "start_conversation_recording": self._start_conversation_recording,
+            "stop_conversation_recording": self._stop_conversation_recording,
+            "craft_ai_prompt": self._craft_ai_prompt,
+            "auto_inject_context": self._auto_inject_context,
+        }
+
         self.logger = logging.getLogger(__name__)
         self.logger.info(
             f"Simple MCP Server initialized for project: {self.project_id}"
@@ -379,280 +860,7 @@ class SimpleMCPServer:
 
     def get_tools(self) -> List[Dict[str, Any]]:
         """Get available tools for MCP protocol."""
-        return [
-            {
-                "name": "push_memory",
-                "description": "Push a memory entry to the server",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "content": {
-                            "type": "string",
-                            "description": "The memory content to store",
-                        },
-                        "memory_type": {
-                            "type": "string",
-                            "enum": ["fact", "preference", "task", "thread"],
-                            "description": "Type of memory entry",
-                        },
-                        "priority": {
-                            "type": "string",
-                            "enum": ["low", "medium", "high", "critical"],
-                            "description": "Priority level of the memory",
-                        },
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Tags for categorization",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                    },
-                    "required": ["content"],
-                },
-            },
-            {
-                "name": "fetch_memory",
-                "description": "Fetch memories based on search criteria",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {
-                            "type": "string",
-                            "description": "Search query for semantic search",
-                        },
-                        "tags": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Filter by tags",
-                        },
-                        "memory_type": {
-                            "type": "string",
-                            "enum": ["fact", "preference", "task", "thread"],
-                            "description": "Filter by memory type",
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "Maximum number of results",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "get_agent_stats",
-                "description": "Get statistics for an agent",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "agent_id": {
-                            "type": "string",
-                            "description": "Agent identifier",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                    },
-                    "required": ["agent_id"],
-                },
-            },
-            {
-                "name": "register_agent",
-                "description": "Register a new agent",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "name": {"type": "string", "description": "Agent name"},
-                        "agent_type": {
-                            "type": "string",
-                            "enum": ["chatbot", "cli", "web", "mobile", "other"],
-                            "description": "Type of agent",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                    },
-                    "required": ["name"],
-                },
-            },
-            {
-                "name": "get_context_summary",
-                "description": "Generate a context summary for chat session injection",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier to summarize context for",
-                        },
-                        "max_memories": {
-                            "type": "integer",
-                            "description": "Maximum number of memories to include in summary",
-                        },
-                        "include_recent": {
-                            "type": "boolean",
-                            "description": "Include recent memories in summary",
-                        },
-                        "focus_areas": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Specific areas to focus on in summary",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "auto_inject_context",
-                "description": "Automatically inject context for new conversation sessions",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier (auto-detected if not provided)",
-                        },
-                        "max_memories": {
-                            "type": "integer",
-                            "description": "Maximum number of memories to include",
-                        },
-                        "include_recent": {
-                            "type": "boolean",
-                            "description": "Include recent memories",
-                        },
-                        "use_ai_crafting": {
-                            "type": "boolean",
-                            "description": "Use AI prompt crafting for intelligent context",
-                        },
-                        "show_notification": {
-                            "type": "boolean",
-                            "description": "Show injection notification",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "start_conversation_recording",
-                "description": "Start automatic conversation recording for a project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier to record conversations for",
-                        },
-                        "auto_record_user_messages": {
-                            "type": "boolean",
-                            "description": "Automatically record user messages",
-                        },
-                        "auto_record_ai_responses": {
-                            "type": "boolean",
-                            "description": "Automatically record AI responses",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "stop_conversation_recording",
-                "description": "Stop automatic conversation recording and create summary",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        }
-                    },
-                },
-            },
-            {
-                "name": "get_performance_report",
-                "description": "Get performance metrics and recommendations",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "days": {
-                            "type": "integer",
-                            "description": "Number of days to analyze (default: 7)",
-                        },
-                        "include_recommendations": {
-                            "type": "boolean",
-                            "description": "Include AI recommendations (default: true)",
-                        },
-                    },
-                },
-            },
-            {
-                "name": "record_feedback",
-                "description": "Record user feedback about context injection",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "rating": {
-                            "type": "integer",
-                            "minimum": 1,
-                            "maximum": 5,
-                            "description": "User rating (1-5)",
-                        },
-                        "comment": {
-                            "type": "string",
-                            "description": "Optional feedback comment",
-                        },
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                        "context_summary": {
-                            "type": "string",
-                            "description": "Context summary that was provided",
-                        },
-                    },
-                    "required": ["rating"],
-                },
-            },
-            {
-                "name": "craft_ai_prompt",
-                "description": "Craft an intelligent AI prompt using context summary and user input",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {
-                            "type": "string",
-                            "description": "Project identifier",
-                        },
-                        "user_message": {
-                            "type": "string",
-                            "description": "User message to incorporate into the prompt",
-                        },
-                        "prompt_type": {
-                            "type": "string",
-                            "enum": [
-                                "continuation",
-                                "task_focused",
-                                "problem_solving",
-                                "explanation",
-                                "code_review",
-                                "debugging",
-                                "general",
-                            ],
-                            "description": "Type of prompt to craft",
-                        },
-                        "focus_areas": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": "Specific areas to focus on",
-                        },
-                    },
-                    "required": ["project_id"],
-                },
-            },
-        ]
+        return list(MCP_TOOLS)
 
     async def execute_tool(
         self, tool_name: str, arguments: Dict[str, Any]
@@ -661,28 +869,9 @@ class SimpleMCPServer:
         start_time = time.time()
 
         try:
-            if tool_name == "push_memory":
-                result = await self._push_memory(arguments)
-            elif tool_name == "fetch_memory":
-                result = await self._fetch_memory(arguments)
-            elif tool_name == "get_agent_stats":
-                result = await self._get_agent_stats(arguments)
-            elif tool_name == "register_agent":
-                result = await self._register_agent(arguments)
-            elif tool_name == "get_context_summary":
-                result = await self._get_context_summary(arguments)
-            elif tool_name == "get_performance_report":
-                result = await self._get_performance_report(arguments)
-            elif tool_name == "record_feedback":
-                result = await self._record_feedback(arguments)
-            elif tool_name == "start_conversation_recording":
-                result = await self._start_conversation_recording(arguments)
-            elif tool_name == "stop_conversation_recording":
-                result = await self._stop_conversation_recording(arguments)
-            elif tool_name == "craft_ai_prompt":
-                result = await self._craft_ai_prompt(arguments)
-            elif tool_name == "auto_inject_context":
-                result = await self._auto_inject_context(arguments)
+            handler = self._tool_handlers.get(tool_name)
+            if handler is not None:
+                result = await handler(arguments)
             else:
                 result = {"error": f"Unknown tool: {tool_name}"}
 
@@ -1009,7 +1198,10 @@ class SimpleMCPServer:
         include_recommendations = args.get("include_recommendations", True)
 
         try:
-            report = self.performance_monitor.get_performance_report(days=days)
+            # The report queries SQLite, so keep it off the event loop
+            report = await asyncio.to_thread(
+                self.performance_monitor.get_performance_report, days=days
+            )
 
             # Format the report
             report_text = f"📊 **Performance Report (Last {days} days)**\n\n"
@@ -1046,7 +1238,9 @@ class SimpleMCPServer:
 
             # Recommendations
             if include_recommendations:
-                recommendations = self.performance_monitor.get_recommendations()
+                recommendations = await asyncio.to_thread(
+                    self.performance_monitor.get_recommendations
+                )
                 report_text += f"**💡 Recommendations:**\n"
                 for rec in recommendations:
                     report_text += f"• {rec}\n"
@@ -1074,7 +1268,8 @@ class SimpleMCPServer:
         context_summary = args.get("context_summary", "")
 
         try:
-            self.context_monitor.record_context_feedback(
+            await asyncio.to_thread(
+                self.context_monitor.record_context_feedback,
                 rating=rating,
                 comment=comment,
                 project_id=project_id,
@@ -1149,20 +1344,8 @@ class SimpleMCPServer:
 
             # Get conversation statistics
             buffer_size = len(self.conversation_recorder.conversation_buffer)
-            user_messages = len(
-                [
-                    msg
-                    for msg in self.conversation_recorder.conversation_buffer
-                    if msg["type"] == "user"
-                ]
-            )
-            ai_responses = len(
-                [
-                    msg
-                    for msg in self.conversation_recorder.conversation_buffer
-                    if msg["type"] == "ai"
-                ]
-            )
+            user_messages = self.conversation_recorder.user_message_count
+            ai_responses = self.conversation_recorder.ai_response_count
 
             summary_text = (
                 f"✅ Conversation recording stopped for project: {project_id}\n"
@@ -1349,15 +1532,91 @@ class SimpleMCPServer:
             }
 
 
+def use_fast_event_loop():
+    """Run asyncio on uvloop's libuv-based event loop when it is installed."""
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def write_message(message: str):
+    """Write one newline-delimited message to stdout in a single write."""
+    # Keep ordering with anything printed through the text layer (a no-op
+    # when nothing is pending)
+    sys.stdout.flush()
+    stdout = sys.stdout.buffer
+    stdout.write(message.encode("utf-8") + b"\n")
+    stdout.flush()
+
+
+class StdinLineReader:
+    """Reads newline-delimited MCP messages from stdin without blocking."""
+
+    # Largest single message accepted from the client
+    LINE_LIMIT = 16 * 1024 * 1024
+
+    def __init__(self):
+        self._reader = None
+        self._executor = None
+
+    async def start(self):
+        """Attach an asyncio stream to stdin, or fall back to a reader thread."""
+        # A terminal shares its file description with stdout, which must not
+        # be switched to non-blocking mode by the pipe transport
+        if not sys.stdin.isatty():
+            loop = asyncio.get_running_loop()
+            reader = asyncio.StreamReader(limit=self.LINE_LIMIT)
+            try:
+                await loop.connect_read_pipe(
+                    lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+                )
+                self._reader = reader
+                return
+            except (NotImplementedError, ValueError, OSError):
+                # Windows event loops and regular-file stdin do not support pipes
+                pass
+
+        # Dedicated thread so stdin reads never queue behind other work
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mcp-stdin"
+        )
+
+    async def readline(self) -> str:
+        """Read the next line, returning an empty string at end of input."""
+        if self._reader is not None:
+            return (await self._reader.readline()).decode("utf-8")
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, sys.stdin.readline
+        )
+
+    def close(self):
+        """Release the fallback reader thread, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+def configure_default_executor():
+    """Size the event loop's default thread pool from the configuration."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=Config.THREAD_POOL_SIZE, thread_name_prefix="mcp-worker"
+        )
+    )
+
+
 async def main():
     """Main entry point for MCP server using stdin/stdout."""
     server = SimpleMCPServer()
 
+    configure_default_executor()
+    stdin_reader = StdinLineReader()
+    await stdin_reader.start()
+
     # Handle stdio communication following MCP protocol
     while True:
         try:
-            # Read from stdin
-            line = sys.stdin.readline()
+            # Read from stdin without blocking the event loop
+            line = await stdin_reader.readline()
             if not line:
                 break
 
@@ -1382,54 +1641,25 @@ async def main():
                             server.conversation_recorder.record_user_message(
                                 f"User added memory: {content}"
                             )
-                    elif tool_name == "fetch_memory":
-                        server.conversation_recorder.record_user_message(
-                            "User requested memory retrieval"
-                        )
-                    elif tool_name == "get_context_summary":
-                        server.conversation_recorder.record_user_message(
-                            "User requested context summary"
-                        )
-                    elif tool_name == "get_agent_stats":
-                        server.conversation_recorder.record_user_message(
-                            "User requested agent statistics"
-                        )
-                    elif tool_name == "craft_ai_prompt":
-                        server.conversation_recorder.record_user_message(
-                            "User requested AI prompt crafting"
-                        )
                     else:
-                        # Record generic tool call as user interaction
+                        # Fall back to a generic tool call interaction
                         server.conversation_recorder.record_user_message(
-                            f"User called tool: {tool_name}"
+                            TOOL_CALL_MESSAGES.get(tool_name)
+                            or f"User called tool: {tool_name}"
                         )
 
             # Handle different MCP message types
             if method == "initialize":
                 # Initialize response
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {"tools": {}},
-                        "serverInfo": {
-                            "name": "simple-mcp-memory-server",
-                            "version": "0.1.0",
-                        },
-                    },
-                }
-                print(json.dumps(response), flush=True)
+                write_message(
+                    format_result_response(INITIALIZE_RESPONSE_TEMPLATE, request_id)
+                )
 
             elif method == "tools/list":
                 # List tools response
-                tools = server.get_tools()
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {"tools": tools},
-                }
-                print(json.dumps(response), flush=True)
+                write_message(
+                    format_result_response(TOOLS_LIST_RESPONSE_TEMPLATE, request_id)
+                )
 
             elif method == "tools/call":
                 # Call tool response
@@ -1447,12 +1677,22 @@ async def main():
                         )
 
                 response = {"jsonrpc": "2.0", "id": request_id, "result": result}
-                print(json.dumps(response), flush=True)
+                write_message(json.dumps(response))
 
             elif method == "notifications/cancel":
                 # Handle cancellation (if needed)
                 response = {"jsonrpc": "2.0", "id": request_id, "result": None}
-                print(json.dumps(response), flush=True)
+                write_message(json.dumps(response))
+
+            elif request_id is not None:
+                # Unknown request (notifications never get a response)
+                write_message(
+                    format_error_response(
+                        request_id,
+                        JSONRPC_METHOD_NOT_FOUND,
+                        f"Method not found: {method}",
+                    )
+                )
 
         except EOFError:
             # End conversation when connection closes
@@ -1460,13 +1700,18 @@ async def main():
             break
         except Exception as e:
             # Error response
-            error_response = {
-                "jsonrpc": "2.0",
-                "id": request_id if "request_id" in locals() else None,
-                "error": {"code": -32603, "message": str(e)},
-            }
-            print(json.dumps(error_response), flush=True)
+            write_message(
+                format_error_response(
+                    request_id if "request_id" in locals() else None,
+                    JSONRPC_INTERNAL_ERROR,
+                    str(e),
+                )
+            )
+
+    stdin_reader.close()
+    await server.conversation_recorder.shutdown()
 
 
 if __name__ == "__main__":
+    use_fast_event_loop()
     asyncio.run(main())
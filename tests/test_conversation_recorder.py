@@ -0,0 +1,122 @@
+"""
+Tests for the ConversationRecorder used by the simple MCP server.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from src.simple_mcp_server import ConversationRecorder
+
+
+def make_recorder():
+    """Create a recorder that does not schedule auto-recorded memories."""
+    recorder = ConversationRecorder(memory_server=None)
+    recorder.start_conversation("test-project")
+    recorder.auto_record_user = False
+    recorder.auto_record_ai = False
+    return recorder
+
+
+def test_message_statistics():
+    """Message counts and the longest messages are tracked as they arrive."""
+    recorder = make_recorder()
+    recorder.record_user_message("short")
+    recorder.record_user_message("a much longer user message")
+    recorder.record_ai_response("the answer")
+
+    assert recorder.user_message_count == 2
+    assert recorder.ai_response_count == 1
+    assert recorder.longest_user_message == "a much longer user message"
+
+    summary = recorder._create_conversation_summary()
+    assert "User messages: 2" in summary
+    assert "AI responses: 1" in summary
+    assert "Key user input: a much longer user message" in summary
+
+
+def test_start_conversation_resets_statistics():
+    """Starting a new conversation clears the previous statistics."""
+    recorder = make_recorder()
+    recorder.record_user_message("first conversation message")
+    recorder.start_conversation("other-project")
+
+    assert recorder.user_message_count == 0
+    assert recorder._create_conversation_summary() == "Empty conversation"
+
+
+def test_extract_tags():
+    """Technology and conversation tags are extracted from content."""
+    recorder = make_recorder()
+    tags = recorder._extract_tags("deploy the python api with docker?")
+
+    assert tags == ("python", "api", "deployment", "question")
+
+
+def test_conversation_buffer_is_bounded():
+    """Old interactions are evicted once the buffer reaches its limit."""
+    recorder = make_recorder()
+    recorder.max_buffer_size = 3
+    recorder.start_conversation("test-project")
+    for i in range(5):
+        recorder.record_user_message(f"message number {i}")
+
+    assert len(recorder.conversation_buffer) == 3
+    assert recorder.conversation_buffer[0].content == "message number 2"
+    assert recorder.user_message_count == 5
+
+
+class FakeMemoryServer:
+    """Memory server stand-in that remembers pushed memories."""
+
+    def __init__(self):
+        self.pushed = []
+
+    async def _push_memory(self, args):
+        self.pushed.append(args)
+        return {"isError": False}
+
+
+def test_auto_recorded_memories_are_flushed_on_shutdown():
+    """Queued memories are written by the worker before shutdown returns."""
+    memory_server = FakeMemoryServer()
+
+    async def scenario():
+        recorder = ConversationRecorder(memory_server)
+        recorder.start_conversation("test-project")
+        recorder.record_user_message("Please implement the database migration")
+        recorder.record_ai_response("I implemented the database migration script")
+        await recorder.shutdown()
+
+    asyncio.run(scenario())
+
+    assert [args["content"].split("]")[0] for args in memory_server.pushed] == [
+        "[USER_MESSAGE",
+        "[AI_RESPONSE",
+    ]
+
+
+def test_entry_recorded_at_is_wall_clock():
+    """Monotonic entry timestamps convert back to wall-clock time."""
+    recorder = make_recorder()
+    before = datetime.now()
+    recorder.record_user_message("a timestamped message")
+    after = datetime.now()
+
+    recorded_at = recorder.conversation_buffer[0].recorded_at()
+    assert before - timedelta(seconds=1) <= recorded_at <= after + timedelta(seconds=1)
+
+
+def test_extract_tags_matches_whole_words():
+    """Keywords embedded in longer words do not trigger tags."""
+    recorder = make_recorder()
+
+    assert recorder._extract_tags("its a happy community") == ()
+    assert recorder._extract_tags("run pip and npm") == ("python", "javascript")
+
+
+def test_extract_tags_detailed_word_limit():
+    """Only messages longer than twenty words are tagged as detailed."""
+    recorder = make_recorder()
+
+    assert recorder._extract_tags(" ".join(["word"] * 20) + "  ") == ()
+    assert recorder._extract_tags(" ".join(["word"] * 21)) == ("detailed",)
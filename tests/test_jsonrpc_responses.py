@@ -0,0 +1,55 @@
+"""
+Tests for the pre-serialized JSON-RPC responses of the stdio MCP servers.
+"""
+
+import json
+
+from src.simple_mcp_server import (
+    INITIALIZE_RESPONSE_TEMPLATE,
+    JSONRPC_INTERNAL_ERROR,
+    JSONRPC_METHOD_NOT_FOUND,
+    TOOLS_LIST_RESPONSE_TEMPLATE,
+    SimpleMCPServer,
+    format_error_response,
+    format_result_response,
+    result_response_template,
+)
+
+
+def test_error_responses_match_json_dumps():
+    """Templated error responses serialize exactly like the full dict."""
+    for code in (JSONRPC_METHOD_NOT_FOUND, JSONRPC_INTERNAL_ERROR):
+        for request_id in (1, "abc", None):
+            expected = {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {"code": code, "message": 'bad "input" 100%'},
+            }
+            response = format_error_response(request_id, code, 'bad "input" 100%')
+            assert response == json.dumps(expected)
+
+
+def test_result_responses_match_json_dumps():
+    """Templated results keep literal percent signs and splice in the id."""
+    result = {"text": "100% done", "items": [1, 2]}
+    template = result_response_template(result)
+
+    response = format_result_response(template, 42)
+    assert response == json.dumps({"jsonrpc": "2.0", "id": 42, "result": result})
+
+
+def test_initialize_response():
+    """The initialize response advertises the simple server."""
+    response = json.loads(format_result_response(INITIALIZE_RESPONSE_TEMPLATE, 1))
+
+    assert response["id"] == 1
+    assert response["result"]["serverInfo"]["name"] == "simple-mcp-memory-server"
+
+
+def test_tools_list_response_matches_get_tools():
+    """The cached tools/list response advertises the same tools as get_tools."""
+    response = json.loads(format_result_response(TOOLS_LIST_RESPONSE_TEMPLATE, 7))
+    tools = SimpleMCPServer.get_tools(None)
+
+    assert response["result"]["tools"] == tools
+    assert "push_memory" in [tool["name"] for tool in tools]